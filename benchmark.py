@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""Benchmark the poll, decode and publish pipeline.
+
+Usage:
+    python3 benchmark.py [--json report.json] [--baseline old.json] [--tolerance 25]
+                         [--duration 3]
+
+Runs the bridge's own code in-process against a simulated inverter (the
+register contents of simulator.py, answered without wire time) and a broker
+stub that records what would be published, and measures:
+
+    scheduler_tick         one scheduler pass (pop due entries, reschedule them)
+                           with 430 and 4,300 entities
+    decode                 _format_scaled, read_lookup_register and
+                           read_datetime_register on buffered registers
+    discovery              subscribe(): discovery messages for one inverter
+    end_to_end             registers per second through poll_unit(), and the
+                           latency from a register's response to the publish
+                           of each entity decoding it
+
+The environment is taken from .env like the bridge itself, except that the
+Modbus device is the simulated one and skip state goes to a temporary file.
+
+--json writes the report as JSON ("-" for stdout).  With --baseline, every
+metric is compared against an earlier report and the exit status is 1 if any of
+them got worse by more than --tolerance percent.
+"""
+
+import os
+import sys
+import time
+import json
+import random
+import asyncio
+import platform
+import tempfile
+import statistics
+import contextlib
+
+# Scheduler sizes: one inverter's entities, and ten of them
+SCHEDULER_SIZES: tuple = (430, 4300)
+_TICK = 0.1
+
+
+def _setup_env():
+    """Environment the bridge modules are imported under."""
+    from dotenv import load_dotenv
+    load_dotenv()
+    os.environ["MODBUS_DEVICE"] = ""
+    os.environ["MODBUS_ADDRESS"] = "1"
+    os.environ["MQTT_TOPIC"] = os.getenv("MQTT_TOPIC", "srne").split(",")[0]
+    os.environ["MODBUS_SKIP_STATE_FILE"] = os.path.join(tempfile.mkdtemp(prefix="srne-bench-"), "skip.json")
+    # The budget would only measure itself: the simulated bus has no wire time
+    os.environ["MODBUS_BUS_OCCUPANCY"] = "100"
+    for name, value in (("MQTT_USERNAME", "bench"), ("MQTT_PASSWORD", "bench"), ("SYNC_DATETIME_INTERVAL", "60")):
+        os.environ.setdefault(name, value)
+
+
+class SimulatedInstrument:
+    """In-process transport answering from a simulator.Inverter.  It notes when
+    each register was last answered, for the read-to-publish latency."""
+
+    pipeline_depth = 1
+    baudrate = 9600
+
+    def __init__(self, inverter):
+        self.inverter = inverter
+        self.registers = 0
+        self.transactions = 0
+        self.answered: dict[int, float] = {}
+
+    def frame_time(self, nbytes: int) -> float:
+        return nbytes * 10 / self.baudrate
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    async def request(self, slave: int, pdu: bytes, timeout: float):
+        response = self.inverter.handle(pdu)
+        self.transactions += 1
+        if response[0] == 0x03:
+            register = int.from_bytes(pdu[1:3], "big")
+            count = response[1] // 2
+            self.registers += count
+            now = time.perf_counter()
+            for r in range(register, register + count):
+                self.answered[r] = now
+        return response, 0.0
+
+
+class BrokerStub:
+    """Stands in for the paho client: counts publishes and, for state topics,
+    the latency since the register they decode was answered."""
+
+    def __init__(self, instrument: SimulatedInstrument | None = None, topic_registers: dict | None = None):
+        self.instrument = instrument
+        self.topic_registers = topic_registers or {}
+        self.messages = 0
+        self.bytes = 0
+        self.latencies: list[float] = []
+
+    def publish(self, topic, payload=None, retain=False, **kwargs):
+        self.messages += 1
+        self.bytes += len(topic) + len(str(payload or ""))
+        register = self.topic_registers.get(topic)
+        if register is not None and register in self.instrument.answered:
+            self.latencies.append(time.perf_counter() - self.instrument.answered[register])
+
+    def subscribe(self, topic, *args, **kwargs):
+        pass
+
+
+def _timed(fn, duration: float) -> float:
+    """Mean seconds per call of fn, run in rounds for about duration seconds."""
+    calls = 0
+    started = time.perf_counter()
+    rounds = 1
+    while True:
+        for _ in range(rounds):
+            fn()
+        calls += rounds
+        elapsed = time.perf_counter() - started
+        if elapsed >= duration:
+            return elapsed / calls
+        rounds = min(rounds * 2, 10000)
+
+
+def bench_scheduler(intervals: list[float], duration: float) -> dict:
+    from scheduler import Scheduler
+    results = {}
+    for size in SCHEDULER_SIZES:
+        now = [0.0]
+        scheduler = Scheduler(clock=lambda: now[0])
+        rng = random.Random(size)
+        entry_intervals = {f"entry/{i}": intervals[i % len(intervals)] for i in range(size)}
+        for name, interval in entry_intervals.items():
+            scheduler.schedule_in(name, rng.uniform(0, interval))
+        popped = [0]
+
+        def tick():
+            now[0] += _TICK
+            names = scheduler.pop_due()
+            for name in names:
+                scheduler.schedule_in(name, entry_intervals[name])
+            popped[0] += len(names)
+            scheduler.time_until_next()
+
+        ticks = [0]
+
+        def counted():
+            ticks[0] += 1
+            tick()
+
+        seconds = _timed(counted, duration)
+        results[f"scheduler_tick_{size}_us"] = seconds * 1e6
+        results[f"scheduler_due_per_tick_{size}"] = popped[0] / ticks[0]
+    return results
+
+
+def bench_decode(modbus, duration: float) -> dict:
+    dev = modbus.current_device()
+    values = dev.client.transport.inverter.values
+    # Machine state and the fault timestamp, as the config decodes them
+    state_register, datetime_register = 0x0210, 0x020C
+    for register in (state_register, datetime_register, datetime_register + 1, datetime_register + 2):
+        dev.block_buffer[register] = values.get(register, 0)
+    try:
+        return {
+            "decode_format_scaled_us": _timed(lambda: modbus._format_scaled(123.4, 0.1), duration) * 1e6,
+            "decode_lookup_register_us": _timed(
+                lambda: modbus.read_lookup_register(state_register, modbus.MACHINE_STATES), duration) * 1e6,
+            "decode_datetime_register_us": _timed(
+                lambda: modbus.read_datetime_register(datetime_register), duration) * 1e6,
+        }
+    finally:
+        modbus.clear_block_buffer()
+
+
+def bench_discovery(main, unit, duration: float) -> dict:
+    broker = BrokerStub()
+    with contextlib.redirect_stdout(open(os.devnull, "w")):
+        seconds = _timed(lambda: main.subscribe(broker, unit), duration)
+        broker.messages = broker.bytes = 0
+        main.subscribe(broker, unit)
+    return {
+        "discovery_ms": seconds * 1e3,
+        "discovery_messages": broker.messages,
+        "discovery_bytes": broker.bytes,
+    }
+
+
+async def bench_end_to_end(main, modbus, unit, duration: float) -> dict:
+    instrument = unit.modbus_device.client.transport
+    unit.modbus_device.instr.bind(asyncio.get_running_loop())
+    topic_registers = {e.state_topic: e.span[0] for e in unit.entities.values() if e.span is not None}
+    broker = BrokerStub(instrument, topic_registers)
+    main.client = broker
+
+    registers = instrument.registers
+    sweeps = 0
+    started = time.perf_counter()
+    with modbus.use_device(unit.modbus_device), contextlib.redirect_stdout(open(os.devnull, "w")):
+        while time.perf_counter() - started < duration:
+            for name in unit.entities:
+                unit.scheduler.schedule_in(name, 0)
+            await main.poll_unit(unit)
+            sweeps += 1
+    elapsed = time.perf_counter() - started
+    latencies = sorted(broker.latencies)
+    return {
+        "end_to_end_registers_per_s": (instrument.registers - registers) / elapsed,
+        "end_to_end_sweep_ms": elapsed / sweeps * 1e3,
+        "end_to_end_publishes_per_s": broker.messages / elapsed,
+        "read_to_publish_p50_ms": statistics.median(latencies) * 1e3 if latencies else None,
+        "read_to_publish_p99_ms": latencies[int(0.99 * (len(latencies) - 1))] * 1e3 if latencies else None,
+    }
+
+
+# Metrics where a larger number is better; for all others smaller is better.
+# Counts describing the workload are not compared.
+_HIGHER_IS_BETTER: tuple = ("end_to_end_registers_per_s", "end_to_end_publishes_per_s")
+_WORKLOAD: tuple = ("entities", "scheduler_due_per_tick_", "discovery_messages", "discovery_bytes")
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Descriptions of the metrics that regressed by more than tolerance percent."""
+    regressions = []
+    for name, value in results.items():
+        old = baseline.get(name)
+        if value is None or not old or name.startswith(_WORKLOAD):
+            continue
+        change = 100 * (value - old) / old
+        if (-change if name in _HIGHER_IS_BETTER else change) > tolerance:
+            regressions.append(f"{name}: {old:.4g} -> {value:.4g} ({change:+.0f}%)")
+    return regressions
+
+
+def run(duration: float) -> dict:
+    _setup_env()
+    # Printing from the imports (device set-up, config) goes to stderr
+    stdout, sys.stdout = sys.stdout, sys.stderr
+    try:
+        import modbus
+        import simulator
+        import register_map
+        inverter = simulator.Inverter(1, register_map.REGISTERS, set(), random.Random(1))
+        instrument = SimulatedInstrument(inverter)
+        for bus in modbus.buses.values():
+            bus.transport = instrument
+        for dev in modbus.devices:
+            dev.client.transport = instrument
+        import main
+    finally:
+        sys.stdout = stdout
+
+    unit = main.units[0]
+    with modbus.use_device(unit.modbus_device), contextlib.redirect_stdout(sys.stderr):
+        asyncio.run(modbus.identify())
+        unit.identify()
+    intervals = [entity.interval for entity in unit.entities.values() if entity.interval > 0]
+    results = {"entities": len(unit.mqtt_config)}
+    results.update(bench_scheduler(intervals, duration))
+    with modbus.use_device(unit.modbus_device):
+        results.update(bench_decode(modbus, duration))
+    results.update(bench_discovery(main, unit, duration))
+    results.update(asyncio.run(bench_end_to_end(main, modbus, unit, duration)))
+    return results
+
+
+def print_report(results: dict):
+    for name, value in results.items():
+        print(f"{name:<34} {value:>14.4g}" if isinstance(value, float) else f"{name:<34} {value!s:>14}")
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--json", default=None, metavar="FILE", help="Write the report as JSON ('-' for stdout)")
+    parser.add_argument("--baseline", default=None, metavar="FILE", help="Earlier JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=25.0, help="Allowed regression in percent (default: 25)")
+    parser.add_argument("--duration", type=float, default=3.0, help="Seconds spent on each measurement (default: 3)")
+    args = parser.parse_args()
+
+    results = run(args.duration)
+    report = {
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    if args.json == "-":
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(results)
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f)["results"], args.tolerance)
+        for line in regressions:
+            print(f"Regression: {line}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""Record Modbus transactions to a binary log and replay them as a transport.
+
+Usage:
+    python3 capture.py capture.bin [--timings]
+
+Set MODBUS_CAPTURE to a file name and every request the bridge sends and every
+response, timeout or error it gets back is appended to it with its monotonic
+time.  Point MODBUS_DEVICE at replay:///path/to/capture.bin to run the bridge
+against the recording instead of an inverter: each request is answered with the
+next recorded outcome of the same request, after the time it took on site.
+Add ?fast to answer straight away, or ?speed=N to replay N times faster.
+
+The log starts with a header (magic, wall-clock start time, baud rate, pipeline
+depth), followed by one record per frame:
+
+    float64 seconds since start, uint16 sequence, uint8 kind, uint8 slave,
+    uint16 payload length, payload
+
+Requests and their outcomes share a sequence number.  The payload of a request
+is its PDU, of a response the float32 response latency followed by the PDU, of
+an error its exception class and message.  Timeouts have no payload.
+
+Run as a script it prints the records of a log, or with --timings the
+register,count,seconds lines plan_capacity.py --calibrate reads (it also takes
+the capture itself).
+"""
+
+import time
+import struct
+import asyncio
+import itertools
+from urllib.parse import parse_qs
+
+import rtu
+
+MAGIC = b"SRNECAP1"
+_HEADER = struct.Struct("<8sdIB")
+_RECORD = struct.Struct("<dHBBH")
+_LATENCY = struct.Struct("<f")
+
+REQUEST = 0
+RESPONSE = 1
+TIMEOUT = 2
+ERROR = 3
+KINDS: tuple = ("request", "response", "timeout", "error")
+
+# Buffered records are flushed to disk at least this often
+_FLUSH_INTERVAL = 1.0
+
+
+class CaptureWriter:
+    """Append-only frame log.  Records are buffered and flushed every
+    _FLUSH_INTERVAL seconds, so capturing costs no disk write per transaction."""
+
+    def __init__(self, path: str, baudrate: int, pipeline_depth: int):
+        self.path = path
+        self._file = open(path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, time.time(), baudrate, pipeline_depth))
+        self._started = time.monotonic()
+        self._flushed = self._started
+        self._sequence = itertools.count()
+
+    def next_sequence(self) -> int:
+        return next(self._sequence) & 0xFFFF
+
+    def write(self, kind: int, sequence: int, slave: int, payload: bytes = b""):
+        now = time.monotonic()
+        self._file.write(_RECORD.pack(now - self._started, sequence, kind, slave, len(payload)) + payload)
+        if now - self._flushed >= _FLUSH_INTERVAL:
+            self._file.flush()
+            self._flushed = now
+
+    def close(self):
+        self._file.close()
+
+
+class CaptureTransport:
+    """Wraps a transport and records every transaction through it."""
+
+    def __init__(self, inner, writer: CaptureWriter):
+        self.inner = inner
+        self.writer = writer
+
+    def __getattr__(self, name):
+        # pipeline_depth, baudrate, frame_time, open, close ... of the real transport
+        return getattr(self.inner, name)
+
+    async def request(self, slave: int, pdu: bytes, timeout: float):
+        sequence = self.writer.next_sequence()
+        self.writer.write(REQUEST, sequence, slave, pdu)
+        try:
+            response, latency = await self.inner.request(slave, pdu, timeout)
+        except rtu.NoResponseError:
+            self.writer.write(TIMEOUT, sequence, slave)
+            raise
+        except Exception as e:
+            self.writer.write(ERROR, sequence, slave, f"{type(e).__name__}: {e}".encode())
+            raise
+        self.writer.write(RESPONSE, sequence, slave, _LATENCY.pack(latency) + response)
+        return response, latency
+
+
+def read_capture(path: str):
+    """Header (wall-clock start, baud rate, pipeline depth) and the list of
+    records (seconds, sequence, kind, slave, payload) of a capture file."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not a Modbus capture")
+    _, started, baudrate, depth = _HEADER.unpack_from(data)
+    records = []
+    offset = _HEADER.size
+    # A capture cut short by a crash ends with a partial record, which is dropped
+    while offset + _RECORD.size <= len(data):
+        seconds, sequence, kind, slave, length = _RECORD.unpack_from(data, offset)
+        offset += _RECORD.size
+        if offset + length > len(data):
+            break
+        records.append((seconds, sequence, kind, slave, data[offset:offset + length]))
+        offset += length
+    return (started, baudrate, depth), records
+
+
+def transactions(records):
+    """Pair requests with their outcomes: (slave, request PDU, sent at, outcome
+    kind, seconds taken, payload) in the order the requests were sent.  Requests
+    whose outcome is missing (cancelled, or the capture was cut) are left out."""
+    pending = {}
+    paired = []
+    for seconds, sequence, kind, slave, payload in records:
+        if kind == REQUEST:
+            pending[sequence] = (len(paired), seconds, slave, payload)
+            paired.append(None)
+        elif sequence in pending:
+            index, sent, slave, request = pending.pop(sequence)
+            paired[index] = (slave, request, sent, kind, seconds - sent, payload)
+    return [t for t in paired if t is not None]
+
+
+def timings(path: str):
+    """(register, count, seconds) of every answered register read in a capture."""
+    for slave, request, _, kind, elapsed, _ in transactions(read_capture(path)[1]):
+        if kind == RESPONSE and request[0] == rtu.READ_HOLDING_REGISTERS:
+            register, count = struct.unpack_from(">HH", request, 1)
+            yield register, count, elapsed
+
+
+def _error(payload: bytes) -> Exception:
+    name, _, message = payload.decode(errors="replace").partition(": ")
+    error = getattr(rtu, name, None)
+    if isinstance(error, type) and issubclass(error, rtu.ModbusError):
+        return error(message)
+    return rtu.ModbusError(f"{name}: {message}")
+
+
+class ReplayTransport:
+    """Answers requests from a capture.  Each (slave, request) pair is answered
+    with its recorded outcomes in order, starting over once they run out, after
+    the recorded transaction time divided by speed (0 = no waiting).
+
+    The scheduler of the replaying bridge need not coalesce reads the way the
+    recorded one did, so a read that was never recorded is answered from the
+    last replayed value of each register, and times out only if one of them was
+    never read on site.  Writes that were never recorded are acknowledged."""
+
+    def __init__(self, path: str, speed: float = 1.0):
+        self.path = path
+        self.speed = speed
+        (_, self.baudrate, self.pipeline_depth), records = read_capture(path)
+        self.pipeline_depth = max(1, self.pipeline_depth)
+        self._outcomes: dict[tuple, list] = {}
+        self._next: dict[tuple, int] = {}
+        # (slave, register) -> value, seeded with the first value read on site
+        self._registers: dict[tuple, int] = {}
+        latencies = []
+        for slave, request, _, kind, elapsed, payload in transactions(records):
+            self._outcomes.setdefault((slave, request), []).append((kind, elapsed, payload))
+            if kind == RESPONSE:
+                latencies.append(_LATENCY.unpack_from(payload)[0])
+                if request[0] == rtu.READ_HOLDING_REGISTERS:
+                    for register, value in self._read_values(request, payload[_LATENCY.size:]):
+                        self._registers.setdefault((slave, register), value)
+        self._latency = sorted(latencies)[len(latencies) // 2] if latencies else 0.0
+        print(f"Replaying {len(records)} frames from {path} at {'full speed' if not speed else f'{speed:g}x'}")
+
+    def frame_time(self, nbytes: int) -> float:
+        return nbytes * 10 / self.baudrate
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    @staticmethod
+    def _read_values(request: bytes, response: bytes):
+        register = struct.unpack_from(">H", request, 1)[0]
+        if response[0] == rtu.READ_HOLDING_REGISTERS:
+            return enumerate(rtu.decode_registers(response), register)
+        return ()
+
+    def _synthesize(self, slave: int, pdu: bytes):
+        """Response PDU to an unrecorded read, or None if it cannot be answered."""
+        if pdu[0] == rtu.WRITE_MULTIPLE_REGISTERS:
+            return pdu[:5]
+        if pdu[0] != rtu.READ_HOLDING_REGISTERS:
+            return None
+        register, count = struct.unpack_from(">HH", pdu, 1)
+        values = [self._registers.get((slave, r)) for r in range(register, register + count)]
+        if None in values:
+            return None
+        return struct.pack(f">BB{count}H", rtu.READ_HOLDING_REGISTERS, 2 * count, *values)
+
+    async def request(self, slave: int, pdu: bytes, timeout: float):
+        outcomes = self._outcomes.get((slave, pdu))
+        if not outcomes:
+            response = self._synthesize(slave, pdu)
+            if response is None:
+                if self.speed:
+                    await asyncio.sleep(timeout / self.speed)
+                raise rtu.NoResponseError(f"request {pdu.hex()} to slave {slave} not in capture")
+            if self.speed:
+                await asyncio.sleep((self.frame_time(len(pdu) + len(response) + 6) + self._latency) / self.speed)
+            return response, self._latency
+        index = self._next.get((slave, pdu), 0)
+        self._next[(slave, pdu)] = (index + 1) % len(outcomes)
+        kind, elapsed, payload = outcomes[index]
+        if self.speed:
+            await asyncio.sleep(elapsed / self.speed)
+        if kind == TIMEOUT:
+            raise rtu.NoResponseError(f"no response from slave {slave} (replayed)")
+        if kind == ERROR:
+            raise _error(payload)
+        response = payload[_LATENCY.size:]
+        for register, value in self._read_values(pdu, response):
+            self._registers[(slave, register)] = value
+        return response, _LATENCY.unpack_from(payload)[0]
+
+
+def open_replay(path: str, query: str) -> ReplayTransport:
+    """Transport for replay:///path?fast or replay:///path?speed=N."""
+    options = parse_qs(query, keep_blank_values=True)
+    speed = 0.0 if "fast" in options else float(options.get("speed", ["1"])[0])
+    return ReplayTransport(path, speed)
+
+
+def _describe(kind: int, payload: bytes) -> str:
+    if kind == RESPONSE:
+        return f"{payload[_LATENCY.size:].hex()} latency {_LATENCY.unpack_from(payload)[0] * 1000:.1f} ms"
+    if kind == ERROR:
+        return payload.decode(errors="replace")
+    return payload.hex()
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("capture", help="Capture file written with MODBUS_CAPTURE")
+    parser.add_argument("--timings", action="store_true", help="Print register,count,seconds of every answered read")
+    args = parser.parse_args()
+
+    if args.timings:
+        for register, count, seconds in timings(args.capture):
+            print(f"0x{register:04X},{count},{seconds:.6f}")
+        return
+    (started, baudrate, depth), records = read_capture(args.capture)
+    print(f"# started {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(started))}, {baudrate} baud, pipeline depth {depth}")
+    for seconds, sequence, kind, slave, payload in records:
+        print(f"{seconds:12.6f} {sequence:5d} {KINDS[kind]:<8} slave {slave:<3} {_describe(kind, payload)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import os
+import time
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# A command is written once no newer value for its register has arrived for
+# WRITE_DEBOUNCE seconds (but never later than _MAX_DELAY windows after the first),
+# and no sooner than WRITE_MIN_INTERVAL after the previous write to that register.
+# Commands still pending for a register being written join that write.
+WRITE_DEBOUNCE: float = int(os.getenv("WRITE_DEBOUNCE") or 100) / 1000
+WRITE_MIN_INTERVAL: float = int(os.getenv("WRITE_MIN_INTERVAL") or 1000) / 1000
+_MAX_DELAY = 4
+
+
+class CommandIntake:
+    """Pending MQTT commands, at most one per topic.
+
+    A burst of /set messages for the same topic (a Home Assistant slider being
+    dragged) collapses into a write of the last value only.  Writes are rate
+    limited per register, which bit-field topics sharing a register have in common;
+    when one of them is written, the others pending for the register go along, so
+    modbus.write_batch() folds them into one read-modify-write."""
+
+    def __init__(self, debounce: float = WRITE_DEBOUNCE, min_interval: float = WRITE_MIN_INTERVAL, clock=time.monotonic):
+        self.debounce = debounce
+        self.min_interval = min_interval
+        self.clock = clock
+        # key -> (command, due, first submitted, register)
+        self._pending: dict = {}
+        self._last_write: dict = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def submit(self, key, command, register=None):
+        """Queue command for key (typically the unit and topic), replacing a command
+        for the same key that has not been written yet.  register is the key the
+        rate limit applies to; it defaults to key."""
+        now = self.clock()
+        first = self._pending[key][2] if key in self._pending else now
+        due = min(now + self.debounce, first + _MAX_DELAY * self.debounce)
+        self._pending[key] = (command, due, first, key if register is None else register)
+
+    def _ready_at(self, key) -> float:
+        _, due, _, register = self._pending[key]
+        last = self._last_write.get(register)
+        return due if last is None else max(due, last + self.min_interval)
+
+    def time_until_next(self) -> float | None:
+        if not self._pending:
+            return None
+        return max(0.0, min(self._ready_at(key) for key in self._pending) - self.clock())
+
+    def pop_ready(self) -> list:
+        """Remove and return the commands whose debounce window has passed, and
+        those pending for the same registers, in the order they were first submitted."""
+        now = self.clock()
+        registers = {self._pending[key][3] for key in self._pending if self._ready_at(key) <= now}
+        ready = [key for key in self._pending if self._pending[key][3] in registers]
+        for register in registers:
+            self._last_write[register] = now
+        return [self._pending.pop(key)[0] for key in ready]
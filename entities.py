@@ -0,0 +1,92 @@
+"""Compiled form of an mqtt_config: one Entity record per pollable entry.
+
+The poll loop works on these records instead of the config dicts.  The state
+topic, register span, decoder (with its arguments bound), interval, priority
+class and value bounds (from the config, else the register table) of an entry
+are worked out once at start-up instead of being looked up in nested dicts on
+every read.
+
+The dicts remain the source of discovery.  last_value and last_update are
+mirrored into them, because derived entries of mqtt_topic_config read the
+values of other entries from there."""
+
+import functools
+import modbus
+import register_map
+from scheduler import priority_class
+
+
+def pollable(vals: dict) -> bool:
+    return vals.get("enabled", True) and vals.get("topic_type", "sensor") != "button"
+
+
+def _bound(config: dict, key: str) -> float | None:
+    value = config.get(key)
+    return None if value is None else float(value)
+
+
+class Entity:
+    """One polled mqtt_config entry of one inverter."""
+
+    __slots__ = (
+        "name", "vals", "order", "read", "register", "span", "interval", "priority",
+        "state_topic", "attributes_topic", "minimum", "maximum", "last_value", "last_update", "restored",
+    )
+
+    def __init__(self, topic: str, config, name: str, vals: dict, order: int):
+        self.name = name
+        self.vals = vals
+        # Position in mqtt_config: derived entries are decoded after their inputs
+        self.order = order
+        args = vals.get("args")
+        if args is None:
+            self.read = vals["value"]
+            self.register = self.span = None
+        else:
+            self.read = functools.partial(vals["value"], **{**args, "name": vals["config"]["name"]})
+            self.register = args.get("register")
+            self.span = modbus.register_span(vals["value"], args)
+        self.interval: float = vals["interval"]
+        self.priority: int = priority_class(config, name, vals)
+        self.state_topic = f"{topic}/{vals.get('topic_type', 'sensor')}/{name}/state"
+        # Marks a state restored from the snapshot as stale (see snapshot.py)
+        self.attributes_topic = f"{topic}/{vals.get('topic_type', 'sensor')}/{name}/attributes"
+        # Bounds of number entities; a value read outside them is rejected.
+        # Without min/max in the config, the register table's bounds apply.
+        self.minimum = self.maximum = None
+        if vals.get("topic_type") == "number":
+            self.minimum = _bound(vals.get("config", {}), "min")
+            self.maximum = _bound(vals.get("config", {}), "max")
+            if self.minimum is None and self.maximum is None and self.register is not None:
+                self.minimum, self.maximum = register_map.bounds(self.register, args.get("scale", 1.0))
+        self.last_value = vals.get("last_value")
+        self.last_update = vals.get("last_update")
+        # Read time of a value restored from the snapshot, until the entry is read
+        # or written again.  A restored value may be stale, so writes are not
+        # deduplicated against it.
+        self.restored: float | None = None
+
+    def remember(self, value, now: float | None = None):
+        """Record a value read (now = its time) or written (now = None)."""
+        self.last_value = self.vals["last_value"] = value
+        self.restored = None
+        if now is not None:
+            self.last_update = self.vals["last_update"] = now
+
+    def restore(self, value, read: float):
+        """Take over a value of the snapshot, read at time read by an earlier run."""
+        self.last_value = self.vals["last_value"] = value
+        self.restored = read
+
+    def forget(self):
+        """Mark the entry as never read, e.g. after its register recovered."""
+        self.last_update = self.vals["last_update"] = None
+
+
+def compile_entities(topic: str, config) -> dict[str, Entity]:
+    """Entity records of the pollable entries of a loaded mqtt_topic_config, by name."""
+    return {
+        name: Entity(topic, config, name, vals, order)
+        for order, (name, vals) in enumerate(config.mqtt_config.items())
+        if pollable(vals)
+    }
@@ -0,0 +1,312 @@
+"""Loader of the declarative entity map, mqtt_entities.json.
+
+The map lists every entity the bridge publishes: the register and read helper
+it is decoded with, its interval group, its Home Assistant discovery config and
+the write helper of its command topic (schema: mqtt_entities.schema.json).
+
+Loading is done in two steps.  compile_map() validates the file, evaluates the
+"enabled" conditions against the settings, resolves interval groups and
+register addresses, and fills in the scale and sign an entry does not give
+from the register table (register_map.py).  Its result holds only plain data
+and is cached on disk in marshal format, keyed by the hash of the file and of
+the register table, the settings and the intervals, so a restart with an
+unchanged map and .env does not parse or validate it again.  bind() then turns
+the compiled entries into the
+mqtt_config and mqtt_set_config of one inverter, looking up helpers and lookup
+tables in modbus.py and filling in config values that depend on the inverter
+(battery rate, topic); configure() refills the latter once the inverter has
+been identified."""
+
+import os
+import ast
+import json
+import marshal
+import hashlib
+import functools
+import operator
+from dotenv import load_dotenv
+import modbus
+import register_map
+
+load_dotenv()
+
+MAP_FILE: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mqtt_entities.json")
+_CACHE_FILE: str = os.getenv("ENTITY_MAP_CACHE", "entity_map.cache")
+# Bumped whenever the compiled form changes, so older caches are not used
+_CACHE_VERSION = 1
+
+INTERVAL_GROUPS: tuple = ("pv", "battery", "load", "grid", "inverter", "temperature", "general", "statistics", "system")
+TOPIC_TYPES: tuple = ("sensor", "number", "select", "switch", "text", "button")
+
+_ENTITY_KEYS = frozenset({
+    "note", "enabled", "read", "args", "compute", "payload", "interval",
+    "topic_type", "dangerous", "last_value", "config", "write",
+})
+_ARG_KEYS = frozenset({"register", "lookup", "bit", "scale", "integer", "signed", "clean", "prefix", "unit", "format_str"})
+_WRITE_ARG_KEYS = frozenset({"register", "lookup", "bit", "scale"})
+_CONFIG_SPECIALS = frozenset({"battery_rate_times", "unit_topic", "options_of"})
+
+# Arguments of modbus helpers that default to the register table; an entry only
+# gives them where it decodes a register differently from the table
+TABLE_ARGS: dict = {
+    "read_register_value": ("scale", "signed"),
+    "read_clamped_register": ("scale",),
+    "read_long_register": ("scale",),
+    "write_register_value": ("scale",),
+}
+
+# Compiled maps of this process, so every inverter after the first skips the cache file
+_compiled: dict[str, dict] = {}
+
+_COMPARISONS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+
+def _evaluate(node, settings: dict):
+    """Value of a condition: names of settings, literals, comparisons, and/or/not."""
+    if isinstance(node, ast.Expression):
+        return _evaluate(node.body, settings)
+    if isinstance(node, ast.Name):
+        if node.id not in settings:
+            raise ValueError(f"unknown setting {node.id!r}")
+        return settings[node.id]
+    if isinstance(node, ast.Constant) and isinstance(node.value, (bool, int, float, str)):
+        return node.value
+    if isinstance(node, ast.BoolOp):
+        values = (_evaluate(value, settings) for value in node.values)
+        return all(values) if isinstance(node.op, ast.And) else any(values)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return not _evaluate(node.operand, settings)
+    if isinstance(node, ast.Compare) and all(type(op) in _COMPARISONS for op in node.ops):
+        left = _evaluate(node.left, settings)
+        for op, comparator in zip(node.ops, node.comparators):
+            right = _evaluate(comparator, settings)
+            if not _COMPARISONS[type(op)](left, right):
+                return False
+            left = right
+        return True
+    raise ValueError(f"unsupported expression {ast.unparse(node)!r}")
+
+
+def condition(expression: str | bool, settings: dict) -> bool:
+    """Evaluate an "enabled" condition such as "battery" or "split_phase >= 2"."""
+    if isinstance(expression, bool):
+        return expression
+    return bool(_evaluate(ast.parse(expression, mode="eval"), settings))
+
+
+def _register(value) -> int:
+    if not isinstance(value, str) or not value.startswith("0x"):
+        raise ValueError(f"register {value!r} is not a hex string")
+    return int(value, 16)
+
+
+def table_args(helper: str, register: int) -> dict:
+    """Scale and sign the register table gives for a register read or written
+    with helper."""
+    row = register_map.lookup(register)
+    if row is None:
+        return {}
+    return {key: row.scale if key == "scale" else row.signed for key in TABLE_ARGS.get(helper, ())}
+
+
+def _check_args(helper: str, args: dict, allowed: frozenset, where: str) -> dict:
+    unknown = set(args) - allowed
+    if unknown:
+        raise ValueError(f"{where}: unknown argument(s) {', '.join(sorted(unknown))}")
+    compiled = dict(args)
+    if "register" in compiled:
+        compiled["register"] = _register(compiled["register"])
+        compiled = {**table_args(helper, compiled["register"]), **compiled}
+    return compiled
+
+
+def _compile_entity(name: str, entity: dict, settings: dict, intervals: dict) -> dict:
+    unknown = set(entity) - _ENTITY_KEYS
+    if unknown:
+        raise ValueError(f"{name}: unknown key(s) {', '.join(sorted(unknown))}")
+    sources = [key for key in ("read", "compute", "payload") if key in entity]
+    if len(sources) != 1:
+        raise ValueError(f"{name}: needs exactly one of read, compute or payload")
+    if "config" not in entity or "name" not in entity["config"]:
+        raise ValueError(f"{name}: config with a name is required")
+    if entity.get("topic_type", "sensor") not in TOPIC_TYPES:
+        raise ValueError(f"{name}: unknown topic_type {entity['topic_type']!r}")
+
+    vals = {}
+    if "enabled" in entity:
+        try:
+            vals["enabled"] = condition(entity["enabled"], settings)
+        except (ValueError, SyntaxError) as e:
+            raise ValueError(f"{name}: enabled: {e}") from None
+    if "args" in entity:
+        if "read" not in entity:
+            raise ValueError(f"{name}: args belong to a read helper")
+        vals["args"] = _check_args(entity["read"], entity["args"], _ARG_KEYS, name)
+    if "interval" in entity:
+        if entity["interval"] not in INTERVAL_GROUPS:
+            raise ValueError(f"{name}: unknown interval group {entity['interval']!r}")
+        vals["interval"] = intervals[entity["interval"]]
+        vals["last_update"] = None
+    for key in ("topic_type", "dangerous", "last_value"):
+        if key in entity:
+            vals[key] = entity[key]
+    vals["config"] = entity["config"]
+    computed = [key for key, value in entity["config"].items() if isinstance(value, dict)]
+    for key in computed:
+        value = entity["config"][key]
+        if len(value) != 1 or not set(value) <= _CONFIG_SPECIALS:
+            raise ValueError(f"{name}: config {key} has an unknown computed value")
+    compiled = {"vals": vals, sources[0]: entity[sources[0]], "computed_config": computed}
+    if "write" in entity:
+        write = entity["write"]
+        if "helper" not in write:
+            raise ValueError(f"{name}: write needs a helper")
+        compiled["write"] = {"helper": write["helper"], "args": _check_args(write["helper"], write.get("args", {}), _WRITE_ARG_KEYS, name)}
+    return compiled
+
+
+def compile_map(data: dict, settings: dict, intervals: dict) -> dict:
+    """Validated plain-data form of a parsed entity map under the given
+    settings (names usable in "enabled") and intervals (seconds per group)."""
+    entities = data.get("entities")
+    if not isinstance(entities, dict):
+        raise ValueError("the entity map has no entities object")
+    return {name: _compile_entity(name, entity, settings, intervals) for name, entity in entities.items()}
+
+
+def _load_cache(key: str):
+    try:
+        with open(_CACHE_FILE, "rb") as f:
+            cached = marshal.loads(f.read())
+        if cached.get("key") == key:
+            return cached["entities"]
+    except:
+        pass
+    return None
+
+
+def _save_cache(key: str, compiled: dict):
+    temp = f"{_CACHE_FILE}.tmp"
+    try:
+        with open(temp, "wb") as f:
+            f.write(marshal.dumps({"key": key, "entities": compiled}))
+        os.replace(temp, _CACHE_FILE)
+    except Exception as e:
+        print(f"Could not write entity map cache {_CACHE_FILE}: {e}")
+
+
+def load(settings: dict, intervals: dict, path: str = MAP_FILE) -> dict:
+    """Compiled entity map, from memory, the cache file or the map itself."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw)
+    digest.update(register_map.FINGERPRINT.encode())
+    digest.update(repr((_CACHE_VERSION, sorted(settings.items()), sorted(intervals.items()))).encode())
+    key = digest.hexdigest()
+    compiled = _compiled.get(key)
+    if compiled is None:
+        compiled = _load_cache(key)
+        if compiled is None:
+            compiled = compile_map(json.loads(raw), settings, intervals)
+            _save_cache(key, compiled)
+        _compiled[key] = compiled
+    return compiled
+
+
+def _modbus_attribute(name: str, where: str):
+    value = getattr(modbus, name, None)
+    if value is None:
+        raise ValueError(f"{where}: modbus has no {name}")
+    return value
+
+
+def _args(args: dict, where: str) -> dict:
+    if "lookup" not in args:
+        return dict(args)
+    return {**args, "lookup": _modbus_attribute(args["lookup"], where)}
+
+
+def _config_value(value: dict, topic: str, where: str):
+    if "battery_rate_times" in value:
+        return value["battery_rate_times"] * modbus.current_device().battery_rate
+    if "unit_topic" in value:
+        return f"{topic}/{value['unit_topic']}"
+    return list(_modbus_attribute(value["options_of"], where).values())
+
+
+def _computed(compute: dict, mqtt_config: dict, functions: dict, where: str):
+    """Callable of a compute entry.  Entries derived from other entries read
+    their last values when called, like the poll loop expects."""
+    def last(name):
+        return float(mqtt_config[name]["last_value"])
+
+    if "sum" in compute:
+        names = compute["sum"]
+        return lambda: round(functools.reduce(operator.add, map(last, names)), 1)
+    if "product" in compute:
+        names = compute["product"]
+        return lambda: round(functools.reduce(operator.mul, map(last, names)), 1)
+    if "difference" in compute:
+        names = compute["difference"]
+        return lambda: round(functools.reduce(operator.sub, map(last, names)), 1)
+    if "last_value" in compute:
+        name = compute["last_value"]
+        return lambda: mqtt_config[name]["last_value"]
+    function = functions.get(compute.get("function"))
+    if function is None:
+        raise ValueError(f"{where}: unknown compute function {compute.get('function')!r}")
+    return functools.partial(function, *compute.get("args", ()))
+
+
+def _update_value(value):
+    return "update_value"
+
+
+def _writer(helper, args: dict):
+    def write(value):
+        return helper(**args, value=value)
+    return write
+
+
+def bind(compiled: dict, topic: str, functions: dict) -> tuple[dict, dict]:
+    """mqtt_config and mqtt_set_config of the current inverter (selected with
+    modbus.use_device()), whose MQTT topic is topic.  functions are the named
+    callables compute entries may refer to."""
+    mqtt_config = {}
+    mqtt_set_config = {}
+    for name, entry in compiled.items():
+        vals = dict(entry["vals"])
+        if "read" in entry:
+            vals["value"] = _modbus_attribute(entry["read"], name)
+        elif "compute" in entry:
+            vals["value"] = _computed(entry["compute"], mqtt_config, functions, name)
+        else:
+            vals["value"] = entry["payload"]
+        if "args" in vals:
+            vals["args"] = _args(vals["args"], name)
+        vals["config"] = dict(vals["config"])
+        mqtt_config[name] = vals
+        write = entry.get("write")
+        if write is not None:
+            if write["helper"] == "update_value":
+                mqtt_set_config[name] = _update_value
+            else:
+                mqtt_set_config[name] = _writer(_modbus_attribute(write["helper"], name), _args(write["args"], name))
+    configure(compiled, mqtt_config, topic)
+    return mqtt_config, mqtt_set_config
+
+
+def configure(compiled: dict, mqtt_config: dict, topic: str):
+    """Fill in the config values of a bound mqtt_config that depend on the
+    inverter.  Called again once modbus.identify() has read the battery rate."""
+    for name, entry in compiled.items():
+        config = mqtt_config[name]["config"]
+        for key in entry["computed_config"]:
+            config[key] = _config_value(entry["vals"]["config"][key], topic, name)
@@ -8,7 +8,7 @@ Usage:
 Reads:
     register_skip_state.json  — written by modbus.py at runtime
     lovelace-dashboard.yaml   — the full template dashboard
-    mqtt_topic_config.py      — to map register addresses to entity IDs
+    mqtt_entities.json        — to map register addresses to entity IDs
     .env                      — for MQTT_TOPIC (device slug)
 
 Writes:
@@ -53,58 +53,22 @@ def load_skip_state(path: str) -> set[int]:
 
 
 def build_excluded_entity_ids(skipped_regs: set[int], mqtt_topic: str) -> set[str]:
-    """Parse mqtt_topic_config.py statically to find entity IDs whose register
-    is in the skip set."""
+    """Find the entity IDs of mqtt_entities.json whose register is in the skip set."""
     device_slug = re.sub(r"[^a-z0-9]+", "_", mqtt_topic.lower()).strip("_")
     excluded = set()
 
     try:
-        with open("mqtt_topic_config.py") as f:
-            content = f.read()
+        with open("mqtt_entities.json") as f:
+            entities = json.load(f)["entities"]
     except FileNotFoundError:
-        print("Warning: mqtt_topic_config.py not found", file=sys.stderr)
+        print("Warning: mqtt_entities.json not found", file=sys.stderr)
         return excluded
 
-    config_start = content.find("mqtt_config: dict")
-    if config_start == -1:
-        return excluded
-    section = content[config_start:]
-
-    current_key = None
-    current_type = "sensor"
-    current_name = None
-    current_register = None
-
-    def flush():
-        nonlocal current_key, current_type, current_name, current_register
-        if current_key and current_name and current_register is not None:
-            if current_register in skipped_regs:
-                entity_id = f"{current_type}.{device_slug}_{slugify(current_name)}"
-                excluded.add(entity_id)
-        current_key = None
-        current_type = "sensor"
-        current_name = None
-        current_register = None
-
-    for line in section.split("\n"):
-        km = re.match(r'\s{4}"([^"]+)":\s*\{', line)
-        if km:
-            flush()
-            current_key = km.group(1)
-
-        if current_key:
-            tm = re.search(r'"topic_type":\s*"([^"]+)"', line)
-            if tm:
-                current_type = tm.group(1)
-            nm = re.search(r'"name":\s*"([^"]+)"', line)
-            if nm and current_name is None:
-                current_name = nm.group(1)
-            rm = re.search(r'"register":\s*(0x[0-9A-Fa-f]+|\d+)', line)
-            if rm and current_register is None:
-                raw = rm.group(1)
-                current_register = int(raw, 16) if raw.startswith("0x") else int(raw)
-
-    flush()
+    for entity in entities.values():
+        register = entity.get("args", {}).get("register")
+        if register is not None and int(register, 16) in skipped_regs:
+            topic_type = entity.get("topic_type", "sensor")
+            excluded.add(f"{topic_type}.{device_slug}_{slugify(entity['config']['name'])}")
     return excluded
 
 
@@ -0,0 +1,76 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Bounds and margin for the per-transaction timeout.  MODBUS_TIMEOUT is used until
+# a register (or at least its page) has been answered a few times.
+TIMEOUT_MIN: float = float(os.getenv("MODBUS_TIMEOUT_MIN", "0.03"))
+TIMEOUT_MAX: float = float(os.getenv("MODBUS_TIMEOUT_MAX", "0.5"))
+_MARGIN = 2.0
+_MIN_SAMPLES = 3
+_WINDOW = 64
+_ALPHA = 0.2
+
+
+class LatencyStats:
+    """Response latency of one register or page: an EWMA plus the p99 of the last
+    _WINDOW samples."""
+
+    def __init__(self):
+        self.ewma: float | None = None
+        self.count = 0
+        self._window: list[float] = []
+        self._p99: float | None = None
+
+    def add(self, seconds: float):
+        self.ewma = seconds if self.ewma is None else self.ewma + _ALPHA * (seconds - self.ewma)
+        self.count += 1
+        self._window.append(seconds)
+        if len(self._window) > _WINDOW:
+            del self._window[0]
+        self._p99 = None
+
+    @property
+    def p99(self) -> float | None:
+        if self._p99 is None and self._window:
+            ordered = sorted(self._window)
+            self._p99 = ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))]
+        return self._p99
+
+
+class LatencyTracker:
+    """Chooses the timeout of each transaction from the latency observed for its
+    start register, falling back to its page (register & 0xFF00, e.g. 0xF000 for
+    the P09 statistics) and then to the configured default.
+
+    After a timeout the next attempt at that register waits _MARGIN times longer,
+    up to TIMEOUT_MAX, so a register that is merely slow gets the time it needs
+    instead of failing until it is skipped."""
+
+    def __init__(self, default: float, minimum: float = TIMEOUT_MIN, maximum: float = TIMEOUT_MAX):
+        self.default = default
+        self.minimum = minimum
+        self.maximum = maximum
+        self.registers: dict[int, LatencyStats] = {}
+        self.pages: dict[int, LatencyStats] = {}
+        self._expired: dict[int, float] = {}
+
+    def timeout_for(self, register: int) -> float:
+        timeout = self.default
+        for stats in (self.registers.get(register), self.pages.get(register & 0xFF00)):
+            if stats is not None and stats.count >= _MIN_SAMPLES:
+                timeout = min(max(_MARGIN * max(stats.p99, stats.ewma), self.minimum), self.maximum)
+                break
+        expired = self._expired.get(register)
+        if expired is not None:
+            timeout = max(timeout, min(_MARGIN * expired, self.maximum))
+        return timeout
+
+    def record(self, register: int, seconds: float):
+        self._expired.pop(register, None)
+        self.registers.setdefault(register, LatencyStats()).add(seconds)
+        self.pages.setdefault(register & 0xFF00, LatencyStats()).add(seconds)
+
+    def record_timeout(self, register: int, timeout: float):
+        self._expired[register] = timeout
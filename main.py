@@ -1,60 +1,160 @@
+import time
+
+# Process start, for the time-to-first-publish report
+_process_started: float = time.monotonic()
+
 import os
 import paho.mqtt.client as mqtt
-import time
+import asyncio
 import json
 import signal
 import sys
 import random
+import importlib.util
+import operator
 from dotenv import load_dotenv
 from modbus import debug
 import modbus
-from mqtt_topic_config import mqtt_config, device, mqtt_set_config, LEAD_ACID_BATTERY_TYPES, EQUALIZATION_AVAIL_TOPIC
+import probe
+import snapshot
+import transport
+from scheduler import Scheduler, FairShare, IntervalGovernor, PRIORITY_CLASSES
+from entities import Entity, compile_entities
+from commands import CommandIntake
+from latency import LatencyStats
+import mqtt_topic_config
+from mqtt_topic_config import LEAD_ACID_BATTERY_TYPES
 
 
 load_dotenv()
 
-
-mqtt_topic = os.getenv("MQTT_TOPIC") or ""
-
 # Sync inverter datetime
-last_datetime_sync = None
 datetime_sync_interval = (
     int(os.getenv("SYNC_DATETIME_INTERVAL")) * 60
 )  # minutes to seconds
 datetime_sync_enabled = os.getenv("SYNC_DATETIME_ENABLED") == "true"
 
-
-writing_queue = []
-publishing_queue = []
-
-_last_equalization_avail: str = ""
-_hidden_register_topics: set = set()
-
-
-def _is_value_in_range(value: str, vals: dict) -> bool:
+# Largest factor the interval of a low priority class is stretched by under overload
+interval_stretch_max: float = float(os.getenv("INTERVAL_STRETCH_MAX") or 8)
+
+
+def _load_unit_config(modbus_device: modbus.Device):
+    """Evaluate mqtt_topic_config for one inverter.  The first inverter uses the
+    imported module; every other one gets its own copy, executed with its device
+    selected, so entries, last values and device info stay separate per unit."""
+    if modbus_device is modbus.devices[0]:
+        return mqtt_topic_config
+    spec = importlib.util.find_spec("mqtt_topic_config")
+    config = importlib.util.module_from_spec(spec)
+    with modbus.use_device(modbus_device):
+        spec.loader.exec_module(config)
+    return config
+
+
+class Unit:
+    """One inverter polled by the bridge: its Modbus device, its mqtt_config and
+    the read deadlines and discovery state kept for it."""
+
+    def __init__(self, modbus_device: modbus.Device):
+        self.modbus_device = modbus_device
+        self.topic = modbus_device.name
+        config = _load_unit_config(modbus_device)
+        self.mqtt_config = config.mqtt_config
+        self.mqtt_set_config = config.mqtt_set_config
+        self.device = config.device
+        # Takes over the serial number, model and battery rate read by modbus.identify()
+        self.identify = config.identify
+        self.bridge_stats = config.bridge_stats
+        self.equalization_avail_topic = config.EQUALIZATION_AVAIL_TOPIC
+        # The pollable entries compiled for the poll loop, and their read deadlines
+        self.entities: dict[str, Entity] = compile_entities(self.topic, config)
+        self.scheduler = Scheduler()
+        # Stretches the lower classes' intervals while reads run late; the
+        # configured interval of each stretchable class, for reporting
+        self.governor = IntervalGovernor(interval_stretch_max)
+        self.class_intervals: dict[str, float] = {
+            "settings": config.general_interval,
+            "statistics": config.statistics_interval,
+            "system": config.system_interval,
+        }
+        # Entries decoding each register, so one fetch serves all of them
+        self.register_entries: dict[int, list[str]] = {}
+        for entity in self.entities.values():
+            if entity.register is not None:
+                self.register_entries.setdefault(entity.register, []).append(entity.name)
+        self.last_equalization_avail: str = ""
+        self.hidden_register_topics: set = set()
+        # Seconds from an MQTT command arriving to its write completing on the bus
+        self.command_latency = LatencyStats()
+        self.bridge_stats["command_latency_p99"] = self.bridge_stats["command_latency_mean"] = 0.0
+        # Entries still showing a value restored from the snapshot
+        self.bridge_stats["restored_values"] = 0
+        self.worker: BusWorker | None = None
+
+
+class BusWorker:
+    """Polls the units on one serial port or gateway.  Every bus has its own
+    poll_loop() task, so ports are read concurrently while all of them publish
+    through the one MQTT client, and its own command_loop() task that writes
+    MQTT commands in between the poll loop's transactions."""
+
+    def __init__(self, bus: modbus.Bus, bus_units: list[Unit]):
+        self.bus = bus
+        self.units = bus_units
+        # Bus time is shared between units so one unit's timeouts cannot starve the others
+        self.fair_share = FairShare()
+        # (time, budget spent) at the start of the current occupancy window
+        self._occupancy_mark = (time.monotonic(), 0.0)
+        self.intake = CommandIntake()
+        # Set when a command arrives so the writer lane wakes up
+        self.commands = asyncio.Event()
+        # Set when the poll loop should wake up early instead of sleeping until
+        # the next deadline (e.g. to re-read a register that was just written)
+        self.wake = asyncio.Event()
+        for unit in bus_units:
+            unit.worker = self
+
+    def occupancy(self) -> float:
+        """Percentage of bus time taken by this bridge over the last minute or so."""
+        budget = self.bus.budget
+        since, spent = self._occupancy_mark
+        now = time.monotonic()
+        if now - since <= 0:
+            return 0.0
+        percent = 100 * (budget.spent - spent) / (now - since)
+        if now - since >= _OCCUPANCY_WINDOW:
+            self._occupancy_mark = (now, budget.spent)
+        return percent
+
+
+units: list[Unit] = [Unit(modbus_device) for modbus_device in modbus.devices]
+units_by_topic: dict[str, Unit] = {unit.topic: unit for unit in units}
+workers: list[BusWorker] = [
+    BusWorker(bus, [unit for unit in units if unit.modbus_device.bus is bus]) for bus in modbus.buses.values()
+]
+
+
+def _is_value_in_range(value: str, entity: Entity) -> bool:
     """Return False if a number entity value is outside its configured min/max.
     Non-number entities always pass."""
-    if vals.get("topic_type") != "number":
-        return True
-    config = vals.get("config", {})
-    min_val = config.get("min")
-    max_val = config.get("max")
+    min_val = entity.minimum
+    max_val = entity.maximum
     if min_val is None and max_val is None:
         return True
     try:
         v = float(value)
-        if min_val is not None and v < float(min_val):
+        if min_val is not None and v < min_val:
             return False
-        if max_val is not None and v > float(max_val):
+        if max_val is not None and v > max_val:
             return False
     except (ValueError, TypeError):
         return False
     return True
 
 
-def _hide_topic(client, name: str, vals: dict):
+def _hide_topic(client, unit: Unit, name: str, vals: dict):
     """Publish an empty retained payload to remove a topic from HA discovery."""
-    field_name = f"{mqtt_topic}-{name.replace('/', '-')}"
+    field_name = f"{unit.topic}-{name.replace('/', '-')}"
     client.publish(
         f"homeassistant/{vals.get('topic_type', 'sensor')}/{field_name}/config",
         "",
@@ -63,36 +163,39 @@ def _hide_topic(client, name: str, vals: dict):
     print(f"Disabled HA entity for unsupported register: {name}")
 
 
-def _restore_topic(client, name: str, vals: dict):
+def _restore_topic(client, unit: Unit, name: str, vals: dict):
     """Re-publish a discovery message for a topic whose register has recovered."""
-    field_name = f"{mqtt_topic}-{name.replace('/', '-')}"
+    field_name = f"{unit.topic}-{name.replace('/', '-')}"
     discovery_data = {
-        "device": device,
+        "device": unit.device,
         "uniq_id": field_name,
         **{key: vals["config"][key] for key in vals["config"]},
     }
     if vals.get("topic_type", "sensor") != "button":
         discovery_data["state_topic"] = (
-            f"{mqtt_topic}/{vals.get('topic_type', 'sensor')}/{name}/state"
+            f"{unit.topic}/{vals.get('topic_type', 'sensor')}/{name}/state"
         )
     client.publish(
         f"homeassistant/{vals.get('topic_type', 'sensor')}/{field_name}/config",
         json.dumps(discovery_data),
         retain=True,
     )
-    vals["last_update"] = None  # force immediate re-read
+    unit.entities[name].forget()  # force immediate re-read
     print(f"Restored HA entity for recovered register: {name}")
 
 
-def publish_equalization_availability(client):
+def publish_equalization_availability(client, unit: Unit):
     """Publish online/offline to the equalization availability topic based on battery type."""
-    global _last_equalization_avail
-    battery_type = mqtt_config.get("battery/type", {}).get("last_value")
+    battery_type = unit.mqtt_config.get("battery/type", {}).get("last_value")
+    # Not read yet: the retained state stands until the poll reads it, rather than
+    # flipping the equalization entities offline for a moment on every start
+    if battery_type is None and "battery/type" in unit.entities and "battery/type" not in unit.hidden_register_topics:
+        return
     payload = "online" if battery_type in LEAD_ACID_BATTERY_TYPES else "offline"
-    if payload != _last_equalization_avail:
-        client.publish(EQUALIZATION_AVAIL_TOPIC, payload, retain=True)
-        _last_equalization_avail = payload
-        print(f"Equalization availability: {payload} (battery type: {battery_type})")
+    if payload != unit.last_equalization_avail:
+        client.publish(unit.equalization_avail_topic, payload, retain=True)
+        unit.last_equalization_avail = payload
+        print(f"Equalization availability of {unit.topic}: {payload} (battery type: {battery_type})")
 
 
 # This code establishes a connection to an MQTT server and continuously sends data to Home Assistant
@@ -100,17 +203,26 @@ def on_connect(client, userdata, connect_flags, reason_code, properties):
     print(f"Connected with result code {reason_code}")
     if reason_code.is_failure:
         return
-    subscribe(client)
-    # Read battery type immediately so equalization availability is correct from the start
-    battery_type = modbus.read_lookup_register(0xE004, modbus.BATTERY_TYPES)
-    if battery_type is not None:
-        mqtt_config["battery/type"]["last_value"] = battery_type
-    publish_equalization_availability(client)
+    # Before the inverters are identified, main() publishes discovery once they are
+    if _units_ready.is_set():
+        publish_discovery(client)
+
+
+def publish_discovery(client):
+    """Publish the discovery of every unit and subscribe to its command topics."""
+    for unit in units:
+        subscribe(client, unit)
+        # Read battery type on the next poll so equalization availability is correct from the start
+        if unit.scheduler.is_scheduled("battery/type"):
+            unit.scheduler.schedule_in("battery/type", 0)
+            unit.worker.wake.set()
+        publish_equalization_availability(client, unit)
+    _discovery_published.set()
 
 
 def on_disconnect(client, userdata, disconnect_flags, reason_code, properties):
     if reason_code.is_failure:
-        print(f"Unexpected MQTT disconnect: {reason_code} — will auto-reconnect")
+        print(f"Unexpected MQTT disconnect: {reason_code} — will reconnect")
     else:
         print("MQTT disconnected cleanly")
 
@@ -120,6 +232,10 @@ def on_message(client, userdata, msg):
     topic = msg.topic
     payload = msg.payload.decode()
     topic = topic.split("/")  # remove the first two '/' in the topic
+    unit = units_by_topic.get(topic[0])
+    if unit is None:
+        return
+    mqtt_config = unit.mqtt_config
     topic = "/".join(topic[2:-1])  # reassemble the topic without leading '/'
     if topic in mqtt_config:
         if "topic_type" in mqtt_config[topic]:
@@ -134,22 +250,22 @@ def on_message(client, userdata, msg):
                     f"Received message: {msg.payload.decode()} but ignoring since inverter/enable_danger not Enabled"
                 )
                 return
-    if topic in mqtt_set_config:
-        last_value = mqtt_config.get(topic, {}).get("last_value")
-        if (
-            mqtt_config.get(topic, {}).get("topic_type") != "button"
-            and last_value is not None
-            and str(payload) == str(last_value)
-        ):
-            print(f"Received message: {msg.payload.decode()} (skipping write to {topic}: value unchanged)")
-            return
-        writing_queue.append((mqtt_set_config[topic], payload, topic))
+    if topic in unit.mqtt_set_config:
+        # Bursts for the same topic collapse into one write of the latest value
+        register = mqtt_config.get(topic, {}).get("args", {}).get("register")
+        unit.worker.intake.submit(
+            (unit.topic, topic),
+            (unit, unit.mqtt_set_config[topic], payload, topic, time.monotonic()),
+            (unit.topic, register) if register is not None else None,
+        )
+        unit.worker.commands.set()
 
     print(f"Received message: {msg.payload.decode()}")
 
 
-def subscribe(client):
-    for name, vals in mqtt_config.items():
+def subscribe(client, unit: Unit):
+    mqtt_topic = unit.topic
+    for name, vals in unit.mqtt_config.items():
         if not vals.get("enabled", True):
             continue
 
@@ -157,12 +273,14 @@ def subscribe(client):
         if "args" in vals:
             register = vals["args"].get("register")
             if register is not None:
-                if not modbus.is_register_available(register):
-                    _hidden_register_topics.add(name)
+                with modbus.use_device(unit.modbus_device):
+                    available = modbus.is_register_available(register)
+                if not available:
+                    unit.hidden_register_topics.add(name)
                     continue
-                elif name in _hidden_register_topics:
+                elif name in unit.hidden_register_topics:
                     # Register recovered since last connect — restore it
-                    _hidden_register_topics.discard(name)
+                    unit.hidden_register_topics.discard(name)
 
         topic = f"{mqtt_topic}/{vals.get('topic_type', 'sensor')}/{name}/state"
         field_name = f"{mqtt_topic}-{str(name).replace('/','-')}"
@@ -176,12 +294,15 @@ def subscribe(client):
             print(f"Subscribed to {raw_cmd}")
 
         discovery_data = {
-            "device": device,
+            "device": unit.device,
             "uniq_id": field_name,
             **{key: vals["config"][key] for key in vals["config"]},
         }
         if vals.get("topic_type", "sensor") != "button":
             discovery_data["state_topic"] = topic
+        entity = unit.entities.get(name)
+        if snapshot_enabled and entity is not None and snapshot.restorable(entity):
+            discovery_data["json_attributes_topic"] = entity.attributes_topic
 
         json_data = json.dumps(discovery_data)
 
@@ -192,16 +313,50 @@ def subscribe(client):
         )
 
 
-def update_inverter_datetime():
-    global last_datetime_sync
-    if not datetime_sync_enabled:
-        return
-    if (
-        last_datetime_sync is None
-        or (time.time() - last_datetime_sync) > datetime_sync_interval
-    ):
-        modbus.write_system_date_time()
-        last_datetime_sync = time.time()
+async def datetime_sync_loop():
+    """Keep the inverter clock in sync with the host every SYNC_DATETIME_INTERVAL."""
+    while running:
+        for unit in units:
+            # A clock write is a command like any other: it goes ahead of queued reads
+            with modbus.use_device(unit.modbus_device), transport.command_lane():
+                await modbus.write_system_date_time_async()
+        await asyncio.sleep(datetime_sync_interval)
+
+
+def read_entry(entity: Entity):
+    """Read and decode one entity.  Derived entries that depend on values not
+    read yet raise on None inputs; those count as a failed read."""
+    try:
+        return entity.read()
+    except Exception as e:
+        debug(f"Could not compute {entity.name}: {e}")
+        return None
+
+
+class AsyncioMqtt:
+    """Drive a paho client from the asyncio event loop instead of paho's network
+    thread: the MQTT socket is registered with add_reader/add_writer and paho's
+    periodic housekeeping runs in mqtt_loop()."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, client: mqtt.Client):
+        self.loop = loop
+        client.on_socket_open = self.on_socket_open
+        client.on_socket_close = self.on_socket_close
+        client.on_socket_register_write = self.on_socket_register_write
+        client.on_socket_unregister_write = self.on_socket_unregister_write
+
+    def on_socket_open(self, client, userdata, sock):
+        self.loop.add_reader(sock, client.loop_read)
+
+    def on_socket_close(self, client, userdata, sock):
+        self.loop.remove_reader(sock)
+        self.loop.remove_writer(sock)
+
+    def on_socket_register_write(self, client, userdata, sock):
+        self.loop.add_writer(sock, client.loop_write)
+
+    def on_socket_unregister_write(self, client, userdata, sock):
+        self.loop.remove_writer(sock)
 
 
 # Create an instance of the MQTT client
@@ -224,180 +379,445 @@ if not username or not password:
 
 client.username_pw_set(username, password)
 
-
-# Connect to the MQTT server, retrying with backoff if the broker is unavailable
-_retry_delay = 1
-while True:
-    try:
-        client.connect(host, port)
-        break
-    except Exception as e:
-        print(f"MQTT connection failed: {e} — retrying in {_retry_delay}s")
-        time.sleep(_retry_delay)
-        _retry_delay = min(_retry_delay * 2, 60)
-
 loop_sleep: float = int(os.getenv("LOOP_SLEEP") or 200) / 1000
 general_interval: float = int(os.getenv("GENERAL_INTERVAL") or 5000) / 1000
 refresh_interval: float = int(os.getenv("REFRESH_INTERVAL") or 5000) / 1000
-max_reads_per_loop: int = int(os.getenv("MAX_READS_PER_LOOP") or 20)
+_JITTER_MAX = 60.0
+_ORDER = operator.attrgetter("order")
+_OCCUPANCY_WINDOW = 60.0
 
-# Add these variables before the while loop
 running = True
+_stopped = asyncio.Event()
+# Start-up stages: every inverter identified (and probed), discovery published
+_units_ready = asyncio.Event()
+_discovery_published = asyncio.Event()
+# Seconds from process start to the first state published
+_first_publish: float | None = None
 
 
-def signal_handler(signum, frame):
+def stop():
     global running
     print("\nSignal received. Cleaning up...")
     running = False
-
-
-# Register the signal handler
-signal.signal(signal.SIGINT, signal_handler)
-signal.signal(signal.SIGTERM, signal_handler)
-
-# Stagger initial update times so all entries fire within the first 60 seconds,
-# spread evenly to avoid bus saturation.
-# Formula: last_update = now - interval + jitter  →  due in jitter seconds (0..60s).
-# Previous formula (now - jitter) was wrong for long intervals: a 600s entry with
-# jitter=5 would not fire for another 595 seconds.
-_now = time.time()
-_JITTER_MAX = 60.0
-for _vals in mqtt_config.values():
-    _interval = _vals.get("interval")
-    if _interval and _interval > 0:
-        _vals["last_update"] = _now - _interval + random.uniform(0, min(_interval, _JITTER_MAX))
-
-# Loop continuously sending data to Home Assistant
-client.loop_start()
-
-# Wait for on_connect to fire so subscribe() re-publishes all current discovery topics
-# before clearing stale ones — avoids a window where authorization could be affected.
-time.sleep(2.0)
-
-# Clear stale HA discovery topics from previous runs using a separate temporary
-# MQTT client so the cleanup is fully isolated from the main connection.
-_current_disc = {
-    f"homeassistant/{vals.get('topic_type', 'sensor')}/{mqtt_topic}-{name.replace('/', '-')}/config"
-    for name, vals in mqtt_config.items()
-    if vals.get("enabled", True)
-}
-try:
-    _stale: list = []
-    _clean = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, protocol=mqtt.MQTTv311)
-    _clean.username_pw_set(username, password)
-
-    def _disc_collector(c, u, msg):
-        parts = msg.topic.split("/")
-        if (
-            len(parts) == 4
-            and parts[2].startswith(f"{mqtt_topic}-")
-            and msg.payload
-            and msg.topic not in _current_disc
-        ):
-            _stale.append(msg.topic)
-
-    _clean.on_message = _disc_collector
-    _clean.connect(host, port)
-    _clean.subscribe("homeassistant/+/+/config")
-    _end = time.time() + 1.0
-    while time.time() < _end:
-        _clean.loop(timeout=0.1)
-    for _topic in _stale:
-        _clean.publish(_topic, "", retain=True)
-    _clean.disconnect()
-    if _stale:
-        print(f"Cleared {len(_stale)} stale HA discovery topics: {_stale}")
-except Exception as e:
-    print(f"Stale discovery cleanup skipped: {e}")
-
-while running:
+    _stopped.set()
+    for worker in workers:
+        worker.wake.set()
+        worker.commands.set()
+
+
+async def mqtt_loop():
+    """Connect to the MQTT server, retrying with backoff if the broker is unavailable,
+    then run paho's keepalive housekeeping until the connection drops."""
+    retry_delay = 1
+    while running:
+        try:
+            # Probe the broker without blocking the loop; paho's own connect is
+            # synchronous but returns immediately once the broker is reachable.
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), 10)
+            writer.close()
+            client.connect(host, port)
+        except Exception as e:
+            print(f"MQTT connection failed: {e} — retrying in {retry_delay}s")
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, 60)
+            continue
+        retry_delay = 1
+        while running and client.loop_misc() == mqtt.MQTT_ERR_SUCCESS:
+            await asyncio.sleep(1)
+
+
+def clear_stale_discovery():
+    """Clear stale HA discovery topics from previous runs using a separate temporary
+    MQTT client so the cleanup is fully isolated from the main connection."""
+    current_disc = {
+        f"homeassistant/{vals.get('topic_type', 'sensor')}/{unit.topic}-{name.replace('/', '-')}/config"
+        for unit in units
+        for name, vals in unit.mqtt_config.items()
+        if vals.get("enabled", True) and name not in unit.hidden_register_topics
+    }
+    prefixes = tuple(f"{unit.topic}-" for unit in units)
     try:
-        # check if we need to update values
-        if len(writing_queue) > 0:
-            for set_fuction, payload, topic in writing_queue:
-                returnval = set_fuction(payload)
-                if returnval == "update_value":
-                    print("Handling update_value for " + topic)
-                    mqtt_config[topic]["last_value"] = payload
-                if returnval != None:
-                    interval = mqtt_config[topic].get("interval") or 0
-                    current_time = time.time()
-                    mqtt_config[topic]["last_update"] = (
-                        current_time - interval + refresh_interval
-                    )
-                    if topic == "battery/type":
-                        publish_equalization_availability(client)
-
-            writing_queue = []
-            time.sleep(loop_sleep)
-
-        modbus_reads_this_loop = 0
-        for name, vals in mqtt_config.items():
+        stale: list = []
+        clean = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, protocol=mqtt.MQTTv311)
+        clean.username_pw_set(username, password)
+
+        def disc_collector(c, u, msg):
+            parts = msg.topic.split("/")
             if (
-                not vals.get("enabled", True)
-                or vals.get("topic_type", "sensor") == "button"
+                len(parts) == 4
+                and parts[2].startswith(prefixes)
+                and msg.payload
+                and msg.topic not in current_disc
             ):
-                continue
-            last_update = vals.get("last_update")
-            interval = vals.get("interval")
-            current_time = time.time()
-            if last_update is not None:
-                if interval == -1:
-                    continue
-                if current_time - last_update <= interval:
-                    continue
+                stale.append(msg.topic)
+
+        clean.on_message = disc_collector
+        clean.connect(host, port)
+        clean.subscribe("homeassistant/+/+/config")
+        end = time.time() + 1.0
+        while time.time() < end:
+            clean.loop(timeout=0.1)
+        for topic in stale:
+            clean.publish(topic, "", retain=True)
+        clean.disconnect()
+        if stale:
+            print(f"Cleared {len(stale)} stale HA discovery topics: {stale}")
+    except Exception as e:
+        print(f"Stale discovery cleanup skipped: {e}")
+
 
-            is_modbus_read = "args" in vals
-            if is_modbus_read:
-                register = vals["args"].get("register")
-                if register is not None:
-                    if not modbus.is_register_available(register):
-                        if name not in _hidden_register_topics:
-                            _hidden_register_topics.add(name)
-                            _hide_topic(client, name, vals)
-                        continue
-                    if name in _hidden_register_topics:
-                        _hidden_register_topics.discard(name)
-                        _restore_topic(client, name, vals)
-                if modbus_reads_this_loop >= max_reads_per_loop:
+def _reschedule_orphans(unit: Unit, names):
+    """Put back entries popped from the scheduler that an error left unscheduled."""
+    for name in names:
+        entity = unit.entities[name]
+        if not unit.scheduler.is_scheduled(name) and not (entity.interval <= 0 and entity.last_update):
+            unit.scheduler.schedule_in(name, loop_sleep)
+
+
+def _interval(unit: Unit, entity: Entity) -> float:
+    """Interval an entry is currently polled at, stretched if the bus is overloaded."""
+    return unit.governor.interval(entity.priority, entity.interval)
+
+
+def _same_value(payload, last_value) -> bool:
+    """Compare numbers by value ("13" and "13.0" from a number entity are the
+    same setting) and anything else as text."""
+    try:
+        return float(payload) == float(last_value)
+    except (TypeError, ValueError):
+        return str(payload) == str(last_value)
+
+
+def _unchanged(unit: Unit, topic: str, payload) -> bool:
+    """True if a write would not change the last value read from the register."""
+    entity = unit.entities.get(topic)
+    last_value = entity.last_value if entity is not None else None
+    return last_value is not None and entity.restored is None and _same_value(payload, last_value)
+
+
+async def write_entries(unit: Unit, pending: list):
+    """Apply queued (set function, payload, topic) writes for one unit.  Writes to
+    consecutive setting registers go out as one FC16 transaction (modbus.write_batch)."""
+    mqtt_config = unit.mqtt_config
+    # Write helpers use the blocking facade, so they run off the loop; their
+    # transactions are granted the bus ahead of the poll loop's reads, which
+    # stay off the bus until the whole batch is written
+    with modbus.use_device(unit.modbus_device), transport.command_lane(), unit.modbus_device.bus.lock.reserve():
+        results = await asyncio.to_thread(modbus.write_batch, [(set_fuction, payload) for set_fuction, payload, _ in pending])
+    for (_, payload, topic), returnval in zip(pending, results):
+        if returnval == "update_value":
+            print("Handling update_value for " + topic)
+            if topic in unit.entities:
+                unit.entities[topic].remember(payload)
+            else:
+                mqtt_config[topic]["last_value"] = payload
+        if returnval != None:
+            if topic in unit.entities:
+                unit.scheduler.schedule_in(topic, refresh_interval)
+            if topic == "battery/type":
+                publish_equalization_availability(client, unit)
+
+
+async def poll_unit(unit: Unit) -> float | None:
+    """Read one batch of due entries for a unit, as many as the bus budget allows.
+    Returns the seconds until the budget has room for the entries left over, or
+    None if every due entry was read."""
+    publishing_queue = []
+    entities = unit.entities
+    scheduler = unit.scheduler
+    popped = scheduler.pop_due()
+    for name in popped:
+        unit.governor.observe(scheduler.lag[name], _interval(unit, entities[name]))
+    # An entry falling due brings along every entry decoding the same register,
+    # so a register is fetched once however many entities are bound to it.
+    early: dict[str, float] = {}
+    for name in popped:
+        for sibling in unit.register_entries.get(entities[name].register, ()):
+            if sibling not in early and scheduler.is_scheduled(sibling):
+                early[sibling] = scheduler.due_at(sibling)
+                scheduler.cancel(sibling)
+    # Entries are decoded in mqtt_config order so derived values see the
+    # registers they are computed from already updated in this batch.
+    popped += early
+    batch = sorted((entities[name] for name in popped), key=_ORDER)
+    try:
+        due = []
+        for entity in batch:
+            name = entity.name
+            if entity.register is not None:
+                if not modbus.is_register_available(entity.register):
+                    if name not in unit.hidden_register_topics:
+                        unit.hidden_register_topics.add(name)
+                        _hide_topic(client, unit, name, entity.vals)
+                    scheduler.schedule_in(name, _interval(unit, entity) if entity.interval > 0 else _JITTER_MAX)
                     continue
-                modbus_reads_this_loop += 1
+                if name in unit.hidden_register_topics:
+                    unit.hidden_register_topics.discard(name)
+                    _restore_topic(client, unit, name, entity.vals)
+            due.append(entity)
+
+        # Every register an entry decodes is fetched here, asynchronously, so
+        # the helpers below are served from the block buffer without blocking.
+        priorities: dict = {}
+        for entity in due:
+            if entity.span is not None:
+                priorities[entity.span] = min(priorities.get(entity.span, len(PRIORITY_CLASSES)), entity.priority)
+        attempted = await modbus.prefetch(list(priorities), priorities)
+
+        deferred = None
+        now = time.time()
+        for entity in due:
+            name, span = entity.name, entity.span
+            if span is not None and span not in attempted:
+                # Over budget: put back at its original deadline for the next pass
+                scheduler.schedule(name, early[name] if name in early else scheduler.clock() - scheduler.lag[name])
+                deferred = priorities[span] if deferred is None else min(deferred, priorities[span])
+                continue
 
-            debug(f"updating {name}")
-            topic = f"{mqtt_topic}/{vals.get('topic_type', 'sensor')}/{name}/state"
-            if is_modbus_read:
-                vals["args"]["name"] = vals["config"]["name"]
-                value = vals["value"](**vals["args"])
+            debug(f"updating {unit.topic}/{name}")
+            if span is None:
+                # Derived values and helpers without a register argument may
+                # still touch the bus through the blocking facade
+                value = await asyncio.to_thread(read_entry, entity)
             else:
-                value = vals["value"]()
-            if value is not None and is_modbus_read:
-                register = vals["args"].get("register")
-                if register is not None and not _is_value_in_range(value, vals):
-                    debug(f"Out-of-range value for {name}: {value}")
-                    modbus.record_invalid_value(register)
-                    value = None
+                value = read_entry(entity)
+            if value is not None and entity.register is not None and not _is_value_in_range(value, entity):
+                debug(f"Out-of-range value for {name}: {value}")
+                modbus.record_invalid_value(entity.register)
+                value = None
             if value != None:
-                mqtt_config[name]["last_update"] = current_time
-                mqtt_config[name]["last_value"] = value
-                publishing_queue.append((topic, value))
-
-        if len(publishing_queue) > 0:
-            for topic, value in publishing_queue:
-                client.publish(topic, value)
-            publishing_queue = []
+                if entity.restored is not None:
+                    # The restored value is replaced by a live one
+                    publishing_queue.append((entity.attributes_topic, snapshot.attributes(None, now)))
+                entity.remember(value, now)
+                publishing_queue.append((entity.state_topic, value))
+                # An entry scheduled meanwhile was written by the command lane
+                # during this batch; keep its refresh read
+                if entity.interval > 0 and not scheduler.is_scheduled(name):
+                    scheduler.schedule_in(name, _interval(unit, entity))
+            else:
+                # Failed reads are retried after LOOP_SLEEP, backing off on timeouts
+                limit = entity.interval if entity.interval > 0 else _JITTER_MAX
+                scheduler.schedule_in(name, modbus.retry_delay(entity.register, loop_sleep, limit))
+    except Exception:
+        _reschedule_orphans(unit, popped)
+        raise
+    finally:
+        modbus.clear_block_buffer()
+    unit.bridge_stats["read_lag_max"], unit.bridge_stats["read_lag_mean"] = scheduler.lag_summary()
+    unit.bridge_stats["bus_occupancy"] = unit.worker.occupancy()
+    unit.bridge_stats["deadline_miss_ratio"] = 100 * unit.governor.miss_ratio
+    if unit.bridge_stats["restored_values"]:
+        unit.bridge_stats["restored_values"] = sum(1 for entity in entities.values() if entity.restored is not None)
+    for name, interval in unit.class_intervals.items():
+        unit.bridge_stats[f"interval_{name}"] = unit.governor.interval(PRIORITY_CLASSES.index(name), interval)
+
+    if len(publishing_queue) > 0:
+        for topic, value in publishing_queue:
+            client.publish(topic, value)
+        global _first_publish
+        if _first_publish is None:
+            _first_publish = time.monotonic() - _process_started
+            print(f"First values published {_first_publish:.2f}s after start")
+    publish_equalization_availability(client, unit)
+    return None if deferred is None else unit.modbus_device.bus.budget.time_until(deferred)
+
+
+async def command_loop(worker: BusWorker):
+    """Writer lane of a bus: writes MQTT commands as soon as their debounce window
+    has passed.  It runs alongside poll_loop() and its transactions preempt the
+    poll loop's reads at the next transaction boundary (see transport.BusLock)."""
+    while running:
+        try:
+            pending = worker.intake.pop_ready()
+            by_unit: dict[str, list] = {}
+            for unit, set_fuction, payload, topic, received in pending:
+                if _unchanged(unit, topic, payload):
+                    print(f"Skipping write to {topic}: value unchanged")
+                    continue
+                by_unit.setdefault(unit.topic, []).append((set_fuction, payload, topic, received))
+            for topic, unit_pending in by_unit.items():
+                unit = units_by_topic[topic]
+                await write_entries(unit, [(set_fuction, payload, topic) for set_fuction, payload, topic, _ in unit_pending])
+                finished = time.monotonic()
+                for *_, received in unit_pending:
+                    unit.command_latency.add(finished - received)
+                unit.bridge_stats["command_latency_p99"] = unit.command_latency.p99
+                unit.bridge_stats["command_latency_mean"] = unit.command_latency.ewma
+            if by_unit:
+                # Written registers are due for a refresh read
+                worker.wake.set()
+
+            timeout = worker.intake.time_until_next()
+            if timeout != 0:
+                worker.commands.clear()
+                try:
+                    await asyncio.wait_for(worker.commands.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+        except Exception as e:
+            print(f"Command error on {worker.bus.name}: {e}")
+            await asyncio.sleep(loop_sleep)
+
+
+async def poll_loop(worker: BusWorker):
+    while running:
+        try:
+            # One batch per pass, for the unit that has had the least bus time
+            ready = [unit.topic for unit in worker.units if unit.scheduler.time_until_next() == 0]
+            deferred = None
+            if ready:
+                unit = units_by_topic[worker.fair_share.pick(ready)]
+                started = time.monotonic()
+                with modbus.use_device(unit.modbus_device):
+                    try:
+                        deferred = await poll_unit(unit)
+                    finally:
+                        worker.fair_share.charge(unit.topic, time.monotonic() - started)
+
+            modbus.check_reconnect(worker.bus)
+
+            # Sleep until the next read deadline, waking early after a write
+            waits = [unit.scheduler.time_until_next() for unit in worker.units]
+            waits = [w for w in waits if w is not None]
+            timeout = min(waits) if waits else None
+            if timeout == 0 and deferred is not None:
+                # Entries are due but the bus budget is spent: wait for it to refill
+                timeout = deferred
+            if timeout != 0:
+                worker.wake.clear()
+                try:
+                    await asyncio.wait_for(worker.wake.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+        except Exception as e:
+            print(f"Loop error on {worker.bus.name}: {e}")
+            await asyncio.sleep(5)
+
+
+async def start_bus(worker: BusWorker):
+    """Identify the units on a bus and, with MODBUS_PROBE, probe their registers
+    before discovery is published."""
+    for unit in worker.units:
+        with modbus.use_device(unit.modbus_device):
+            await modbus.identify()
+            unit.identify()
+            if probe.probe_enabled:
+                spans = {entity.span for entity in unit.entities.values()}
+                spans.discard(None)
+                await probe.probe_device(spans)
+
+
+def restore_snapshot(client):
+    """Publish the values of the last snapshot for the entries not read yet.
+    They stand until each entry is read at its normal cadence."""
+    saved = snapshot.load()
+    now = time.time()
+    restored = 0
+    for unit in units:
+        for name, (value, read) in saved.get(unit.topic, {}).items():
+            entity = unit.entities.get(name)
+            if entity is None or not snapshot.restorable(entity) or entity.last_update is not None or name in unit.hidden_register_topics:
+                continue
+            entity.restore(value, read)
+            client.publish(entity.state_topic, value)
+            client.publish(entity.attributes_topic, snapshot.attributes(read, now))
+            restored += 1
+        publish_equalization_availability(client, unit)
+        unit.bridge_stats["restored_values"] = sum(1 for entity in unit.entities.values() if entity.restored is not None)
+    if restored:
+        print(f"Published {restored} values from snapshot {snapshot.SNAPSHOT_FILE}")
+
+
+# A replay of a capture neither restores nor overwrites the site's snapshot
+snapshot_enabled: bool = snapshot.snapshot_enabled and not any(bus.replay for bus in modbus.buses.values())
+
+# Last snapshot written, so an unchanged one is not written again
+_snapshot_saved: dict | None = None
+
+
+async def save_snapshot():
+    """Write the last values to the snapshot file if they changed.  The file is
+    written on a worker thread so the poll loop is not held up."""
+    global _snapshot_saved
+    values = {unit.topic: snapshot.take(unit.entities.values()) for unit in units}
+    if values != _snapshot_saved:
+        await asyncio.to_thread(snapshot.save, values)
+        _snapshot_saved = values
+
+
+async def snapshot_loop():
+    while running:
+        await asyncio.sleep(snapshot.SNAPSHOT_INTERVAL)
+        await save_snapshot()
+
+
+async def _unless_stopped(aw) -> bool:
+    """Wait for aw, or until a signal stops the bridge.  Returns False if stopped
+    first; an exception raised by aw is raised again."""
+    task = asyncio.ensure_future(aw)
+    stopped = asyncio.create_task(_stopped.wait())
+    await asyncio.wait([task, stopped], return_when=asyncio.FIRST_COMPLETED)
+    stopped.cancel()
+    if not task.done():
+        task.cancel()
+        return False
+    task.result()
+    return True
 
-        modbus.check_reconnect()
-        update_inverter_datetime()
-        publish_equalization_availability(client)
-        time.sleep(loop_sleep)
 
-    except Exception as e:
-        print(f"Loop error: {e}")
-        publishing_queue = []
-        time.sleep(5)
-
-# Clean up
-print("Disconnecting from MQTT broker...")
-client.loop_stop()
-client.disconnect()
-sys.exit(0)
+async def main():
+    loop = asyncio.get_running_loop()
+    for modbus_device in modbus.devices:
+        modbus_device.instr.bind(loop)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop)
+
+    # The broker connection and the identification of the inverters (one task
+    # per bus) go ahead concurrently; discovery needs both.
+    AsyncioMqtt(loop, client)
+    mqtt_task = asyncio.create_task(mqtt_loop())
+    if await _unless_stopped(asyncio.gather(*(start_bus(worker) for worker in workers))):
+        print(f"Inverters identified {time.monotonic() - _process_started:.2f}s after start")
+        # Stagger initial deadlines so all entries fire within the first 60 seconds
+        # of polling, spread evenly to avoid bus saturation.  Entries without a
+        # positive interval (read-once entries) are due immediately.
+        for unit in units:
+            for name, entity in unit.entities.items():
+                interval = entity.interval
+                jitter = random.uniform(0, min(interval, _JITTER_MAX)) if interval and interval > 0 else 0.0
+                unit.scheduler.schedule_in(name, jitter)
+        _units_ready.set()
+        if client.is_connected():
+            publish_discovery(client)
+        # Otherwise on_connect publishes it
+        await _unless_stopped(_discovery_published.wait())
+
+    tasks = [mqtt_task]
+    if _discovery_published.is_set():
+        if snapshot_enabled:
+            restore_snapshot(client)
+        # Stale topics are only cleared once the current ones are published,
+        # which avoids a window where authorization could be affected.
+        tasks.append(asyncio.create_task(asyncio.to_thread(clear_stale_discovery)))
+    if snapshot_enabled:
+        tasks.append(asyncio.create_task(snapshot_loop()))
+    if datetime_sync_enabled:
+        tasks.append(asyncio.create_task(datetime_sync_loop()))
+    await asyncio.gather(*(poll_loop(worker) for worker in workers), *(command_loop(worker) for worker in workers))
+
+    for task in tasks:
+        task.cancel()
+    # Clean up
+    if snapshot_enabled:
+        await save_snapshot()
+    print("Disconnecting from MQTT broker...")
+    client.disconnect()
+    client.loop_write()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
+    sys.exit(0)
@@ -1,59 +1,219 @@
 import os
 import math
 import json
-import minimalmodbus
+import atexit
+import asyncio
+import contextlib
+import contextvars
 from datetime import datetime
 from dotenv import load_dotenv
 import pytz
+import rtu
+import capture
+import transport
+import register_map
+from latency import LatencyTracker
+from scheduler import TokenBucket
 
 load_dotenv()
 
-modbus_address: int = (
-    int(os.getenv("MODBUS_ADDRESS")) if os.getenv("MODBUS_ADDRESS") else 0
-)
 modbus_instrument = os.getenv("MODBUS_DEVICE")
-print("using address %d on device %s" % (modbus_address, modbus_instrument))
-instr = minimalmodbus.Instrument(modbus_instrument, modbus_address)
-instr.serial.baudrate = 9600
-instr.serial.timeout = float(os.getenv("MODBUS_TIMEOUT", "0.1"))
-# instr.debug = True
+modbus_baudrate: int = int(os.getenv("MODBUS_BAUDRATE") or 9600)
+_MODBUS_TIMEOUT: float = float(os.getenv("MODBUS_TIMEOUT", "0.1"))
 
-_modbus_failures = 0
 _MODBUS_FAILURE_THRESHOLD = 20
 
+# Share of bus time this bridge may occupy; the rest is left to other masters on
+# the line (BMS, data logger).  The budget can bank up to _BUS_BURST seconds.
+_BUS_OCCUPANCY: float = int(os.getenv("MODBUS_BUS_OCCUPANCY") or 80) / 100
+_BUS_BURST = 1.0
+
 # Per-register failure tracking — skip registers that repeatedly time out
 _REGISTER_SKIP_THRESHOLD: int = int(os.getenv("MODBUS_SKIP_THRESHOLD", "5"))
 _REGISTER_RETRY_INTERVAL: float = float(os.getenv("MODBUS_SKIP_RETRY_INTERVAL", "3600"))
 _SKIP_STATE_FILE: str = os.getenv("MODBUS_SKIP_STATE_FILE", "register_skip_state.json")
-_register_failures: dict[int, int] = {}
-_register_skip_time: dict[int, float] = {}
+
+# Record every transaction to this file (one file per port with several ports)
+_CAPTURE_FILE: str = os.getenv("MODBUS_CAPTURE", "")
+
+
+# Error classes, each with its own policy in _record_modbus_result():
+#   illegal_address  exception 2 — the register does not exist, skipped on the first reply
+#   slave_exception  any other exception response — counted, retried with backoff
+#   crc              corrupt or truncated frame — line noise, retried once straight away
+#   timeout          no response — counted, retried with backoff
+#   serial           local port or gateway connection error — not the register's fault
+ERROR_CLASSES: tuple = ("illegal_address", "slave_exception", "crc", "timeout", "serial")
+
+
+def classify_error(error: Exception) -> str:
+    if isinstance(error, rtu.SlaveExceptionError):
+        return "illegal_address" if error.code == 2 else "slave_exception"
+    if isinstance(error, rtu.InvalidResponseError):
+        return "crc"
+    if isinstance(error, rtu.NoResponseError):
+        return "timeout"
+    return "serial"
+
+
+class Bus:
+    """One serial port (or TCP gateway) and the inverters polled through it."""
+
+    def __init__(self, name: str, bus_transport):
+        self.name = name
+        self.transport = bus_transport
+        # Bus time the poll loop may still spend; every transaction is charged to it
+        self.budget = TokenBucket(_BUS_OCCUPANCY, _BUS_BURST)
+        # Every transaction on the bus, from polling, commands or the clock sync, holds this lock
+        self.lock = transport.BusLock(bus_transport.pipeline_depth, meter=self.budget.charge)
+        self.devices: list[Device] = []
+        # A replay of a capture (replay://) reads the skip state and capability
+        # cache of the real inverter but must not write them
+        self.replay: bool = name.startswith("replay://")
+
+
+class Device:
+    """One inverter (Modbus slave) on the bus and the state the helpers keep for it.
+
+    The helpers below act on the device selected with use_device(), so the same
+    mqtt_config callables can poll several inverters sharing one RS485 line."""
+
+    def __init__(self, name: str, bus: Bus, client: transport.ModbusClient, skip_state_file: str):
+        self.name = name
+        self.bus = bus
+        self.address = client.slave
+        # client is the asyncio client the main loop awaits; instr is the blocking
+        # facade the read/write helpers use when called outside the event loop.
+        self.client = client
+        self.instr = transport.Instrument(client)
+        self.skip_state_file = skip_state_file
+        self.consecutive_failures = 0
+        # Failed transactions by error class (see classify_error) and the class of
+        # each register's last failure, which decides how soon it is retried
+        self.error_counts: dict[str, int] = dict.fromkeys(ERROR_CLASSES, 0)
+        self.last_error: dict[int, str] = {}
+        # Register writes collected by write_batch() instead of being sent one by one,
+        # and the registers written by the set function currently running
+        self.write_capture: dict[int, int] | None = None
+        self.write_touched: set = set()
+        self.register_failures: dict[int, int] = {}
+        self.register_skip_time: dict[int, float] = {}
+        # Registers fetched by prefetch() are served to the read helpers from this
+        # buffer, so a run of adjacent entities costs one read_registers transaction
+        # instead of one transaction each.  Cleared by the main loop after every batch.
+        self.block_buffer: dict[int, int] = {}
+        # Errors from spans the main loop tried to prefetch; the helpers re-raise them
+        # instead of issuing a blocking read of their own.
+        self.read_errors: dict[int, Exception] = {}
+        # Registers that were part of a block the inverter rejected; read individually
+        # until MODBUS_SKIP_RETRY_INTERVAL has elapsed.
+        self.unblockable: dict[int, float] = {}
+        # Spans after which a block must end, because a block running on into the
+        # next span was rejected as an illegal address; kept as long as unblockable
+        self.block_breaks: dict[int, float] = {}
+        # Read by identify() at start-up: battery voltage scale (1 = 12 V,
+        # 4 = 48 V), serial number, model and (app, bootloader) firmware versions
+        self.battery_rate: float = 4.0
+        self.serial_number: str | None = None
+        self.model: str | None = None
+        self.firmware: tuple[int, int] | None = None
+
+
+def _parse_devices() -> list[Device]:
+    """Build one Device per MODBUS_ADDRESS entry.  Several comma-separated addresses
+    poll several inverters; MQTT_TOPIC then lists one topic per address (or a single
+    prefix that gets the address appended) and MODBUS_DEVICE either names the one
+    port they share or lists the port of each address."""
+    addresses = [int(a) for a in (os.getenv("MODBUS_ADDRESS") or "0").split(",")]
+    topics = [t.strip() for t in (os.getenv("MQTT_TOPIC") or "").split(",")]
+    if len(topics) != len(addresses):
+        topics = [f"{topics[0]}_{address}" for address in addresses]
+    ports = [p.strip() for p in (modbus_instrument or "").split(",")]
+    if len(ports) == 1:
+        ports = ports * len(addresses)
+    elif len(ports) != len(addresses):
+        raise ValueError("MODBUS_DEVICE must name one device or one device per MODBUS_ADDRESS")
+    devices = []
+    for address, topic, port in zip(addresses, topics, ports):
+        print("using address %d on device %s" % (address, port))
+        if port not in buses:
+            bus_transport = transport.open_transport(port, modbus_baudrate)
+            if _CAPTURE_FILE:
+                bus_transport = _capture(bus_transport, len(buses), len(set(ports)) > 1)
+            buses[port] = Bus(port, bus_transport)
+        bus = buses[port]
+        skip_state_file = _SKIP_STATE_FILE
+        if len(addresses) > 1:
+            root, ext = os.path.splitext(_SKIP_STATE_FILE)
+            skip_state_file = f"{root}-{topic}{ext}"
+        client = transport.ModbusClient(bus.transport, address, latency=LatencyTracker(_MODBUS_TIMEOUT), lock=bus.lock)
+        device = Device(topic, bus, client, skip_state_file)
+        bus.devices.append(device)
+        devices.append(device)
+    return devices
+
+
+def _capture(bus_transport, index: int, several: bool):
+    path = _CAPTURE_FILE
+    if several:
+        root, ext = os.path.splitext(_CAPTURE_FILE)
+        path = f"{root}-{index}{ext}"
+    print(f"Capturing Modbus frames to {path}")
+    writer = capture.CaptureWriter(path, bus_transport.baudrate, bus_transport.pipeline_depth)
+    atexit.register(writer.close)
+    return capture.CaptureTransport(bus_transport, writer)
+
+
+# Ports by MODBUS_DEVICE entry; inverters on the same port share its transport
+buses: dict[str, Bus] = {}
+devices: list[Device] = _parse_devices()
+_current_device: contextvars.ContextVar = contextvars.ContextVar("modbus_device", default=devices[0])
+
+
+def current_device() -> Device:
+    """The device the helpers currently act on."""
+    return _current_device.get()
+
+
+@contextlib.contextmanager
+def use_device(device: Device):
+    """Direct the helpers at the given device within the current task or thread.
+    asyncio.to_thread() carries the selection over to the worker thread."""
+    token = _current_device.set(device)
+    try:
+        yield device
+    finally:
+        _current_device.reset(token)
 
 
-def _load_skip_state():
+def _load_skip_state(dev: Device):
     """Load persisted skip state so previously-failing registers stay skipped across restarts."""
     try:
-        with open(_SKIP_STATE_FILE) as f:
+        with open(dev.skip_state_file) as f:
             data = json.load(f)
         for hex_key, ts in data.items():
-            _register_skip_time[int(hex_key, 16)] = float(ts)
-        if _register_skip_time:
-            print(f"Loaded {len(_register_skip_time)} skipped registers from {_SKIP_STATE_FILE}")
+            dev.register_skip_time[int(hex_key, 16)] = float(ts)
+        if dev.register_skip_time:
+            print(f"Loaded {len(dev.register_skip_time)} skipped registers from {dev.skip_state_file}")
     except FileNotFoundError:
         pass
     except Exception as e:
         print(f"Could not load register skip state: {e}")
 
 
-def _save_skip_state():
+def _save_skip_state(dev: Device):
     """Persist current skip state to disk."""
+    if dev.bus.replay:
+        return
     try:
-        with open(_SKIP_STATE_FILE, "w") as f:
-            json.dump({f"0x{r:04X}": ts for r, ts in _register_skip_time.items()}, f, indent=2)
+        with open(dev.skip_state_file, "w") as f:
+            json.dump({f"0x{r:04X}": ts for r, ts in dev.register_skip_time.items()}, f, indent=2)
     except Exception as e:
         print(f"Could not save register skip state: {e}")
 
 
-_load_skip_state()
+for _device in devices:
+    _load_skip_state(_device)
 
 
 def record_invalid_value(register: int):
@@ -65,66 +225,413 @@ def record_invalid_value(register: int):
 def is_register_available(register: int) -> bool:
     """Return False if the register has been skipped due to repeated failures.
     Automatically un-skips after MODBUS_SKIP_RETRY_INTERVAL seconds."""
-    skip_time = _register_skip_time.get(register)
+    dev = current_device()
+    skip_time = dev.register_skip_time.get(register)
     if skip_time is None:
         return True
+    if dev.last_error.get(register) == "illegal_address":
+        # The inverter reported the address as nonexistent; retrying cannot change that
+        return False
     import time as _time
     if _time.time() - skip_time >= _REGISTER_RETRY_INTERVAL:
-        del _register_skip_time[register]
-        _register_failures.pop(register, None)
-        _save_skip_state()
-        print(f"Modbus: retrying register 0x{register:04X}")
+        del dev.register_skip_time[register]
+        dev.register_failures.pop(register, None)
+        _save_skip_state(dev)
+        print(f"Modbus: retrying register 0x{register:04X} on {dev.name}")
         return True
     return False
 
 
-def _record_modbus_result(success: bool, register: int = 0):
-    global _modbus_failures
+def apply_capabilities(capabilities: dict[int, bool]):
+    """Apply a probe result: unsupported registers are skipped as if they had
+    answered with an illegal-address exception, and supported registers that were
+    skipped by an earlier run are polled again straight away."""
+    import time as _time
+    dev = current_device()
+    now = _time.time()
+    for register, supported in capabilities.items():
+        if supported:
+            if dev.register_skip_time.pop(register, None) is not None:
+                print(f"Modbus: register 0x{register:04X} on {dev.name} answers again — no longer skipped")
+            dev.register_failures.pop(register, None)
+            dev.last_error.pop(register, None)
+        elif register not in dev.register_skip_time:
+            dev.register_skip_time[register] = now
+            dev.register_failures[register] = _REGISTER_SKIP_THRESHOLD
+            dev.last_error[register] = "illegal_address"
+    _save_skip_state(dev)
+
+
+def _record_modbus_result(success: bool, register: int = 0, error: Exception | None = None):
+    """Count a read result against the device and register.  error is the exception
+    of a failed transaction; without one the failure is an invalid value."""
+    dev = current_device()
     if success:
-        _modbus_failures = 0
-        _register_failures.pop(register, None)
-    else:
-        _modbus_failures += 1
-        if register:
-            count = _register_failures.get(register, 0) + 1
-            _register_failures[register] = count
-            if count >= _REGISTER_SKIP_THRESHOLD and register not in _register_skip_time:
-                import time as _time
-                _register_skip_time[register] = _time.time()
-                print(f"Modbus: skipping register 0x{register:04X} after {count} failures")
-                _save_skip_state()
-
-
-def check_reconnect():
+        dev.consecutive_failures = 0
+        dev.register_failures.pop(register, None)
+        dev.last_error.pop(register, None)
+        return
+    dev.consecutive_failures += 1
+    kind = None
+    if error is not None:
+        kind = classify_error(error)
+        dev.error_counts[kind] += 1
+    if not register or kind == "serial":
+        return
+    dev.last_error[register] = kind
+    count = dev.register_failures.get(register, 0) + 1
+    if kind == "illegal_address":
+        # The inverter says the address does not exist; asking again will not help
+        count = max(count, _REGISTER_SKIP_THRESHOLD)
+    dev.register_failures[register] = count
+    if count >= _REGISTER_SKIP_THRESHOLD and register not in dev.register_skip_time:
+        import time as _time
+        dev.register_skip_time[register] = _time.time()
+        reason = "illegal data address" if kind == "illegal_address" else f"{count} failures"
+        print(f"Modbus: skipping register 0x{register:04X} on {dev.name} after {reason}")
+        _save_skip_state(dev)
+
+
+def retry_delay(register: int | None, base: float, limit: float) -> float:
+    """Seconds before retrying a failed read of register.  Timeouts and busy or
+    failing slaves back off exponentially up to limit; other failures retry after base."""
+    dev = current_device()
+    if dev.last_error.get(register) in ("timeout", "slave_exception"):
+        return min(base * 2 ** (dev.register_failures.get(register, 1) - 1), limit)
+    return base
+
+
+def read_error_count(kind: str) -> str:
+    return str(current_device().error_counts[kind])
+
+
+def check_reconnect(bus: Bus):
     """Reopen the serial port if too many consecutive modbus failures (e.g. USB disconnect).
-    Also clears all per-register skip state so every register gets a fresh chance."""
-    global instr, _modbus_failures
-    if _modbus_failures < _MODBUS_FAILURE_THRESHOLD:
+    Also clears the per-register skip state left by failed reads so those registers get a fresh chance.
+    With several inverters on the bus every one of them must be failing, so one
+    powered-down unit does not keep the port cycling under the others."""
+    failures = min(dev.consecutive_failures for dev in bus.devices)
+    if failures < _MODBUS_FAILURE_THRESHOLD:
         return
-    print(f"Modbus: {_modbus_failures} consecutive failures — attempting to reopen serial port")
+    print(f"Modbus: {failures} consecutive failures on {bus.name} — attempting to reopen serial port")
     try:
-        instr.serial.close()
+        bus.transport.close()
     except Exception:
         pass
     try:
-        instr = minimalmodbus.Instrument(modbus_instrument, modbus_address)
-        instr.serial.baudrate = 9600
-        instr.serial.timeout = float(os.getenv("MODBUS_TIMEOUT", "0.1"))
-        _modbus_failures = 0
-        _register_failures.clear()
-        _register_skip_time.clear()
-        _save_skip_state()
+        bus.transport.open()
+        for dev in bus.devices:
+            dev.consecutive_failures = 0
+            # Registers the inverter reported as nonexistent stay skipped
+            for register in [r for r in dev.register_skip_time if dev.last_error.get(r) != "illegal_address"]:
+                del dev.register_skip_time[register]
+                dev.register_failures.pop(register, None)
+            _save_skip_state(dev)
         print("Modbus serial port reopened successfully")
     except Exception as e:
         print(f"Modbus reconnect failed: {e}")
-        _modbus_failures = _MODBUS_FAILURE_THRESHOLD  # keep trying each loop
+        for dev in bus.devices:
+            dev.consecutive_failures = _MODBUS_FAILURE_THRESHOLD  # keep trying each loop
+
+
+# Read once: debug() is called for every value decoded
+_DEBUG: bool = os.getenv("DEBUG") == "true"
 
 
 def debug(msg):
-    if os.getenv("DEBUG") == "true":
+    if _DEBUG:
         print("[{}] {}".format(datetime.now(), msg))
 
 
+############ Block Reads #####################
+
+_BLOCK_PROTOCOL_LIMIT = 125  # max registers per FC03 request
+_BLOCK_MAX_REGISTERS: int = min(int(os.getenv("MODBUS_BLOCK_MAX", "64")), _BLOCK_PROTOCOL_LIMIT)
+_BLOCK_MAX_GAP: int = int(os.getenv("MODBUS_BLOCK_GAP", "4"))
+
+
+def _read_registers(register: int, count: int) -> list[int]:
+    """Multi-register read that is served from the block buffer when fully covered.
+    The result is recorded against the register, classified by error."""
+    dev = current_device()
+    if all(r in dev.block_buffer for r in range(register, register + count)):
+        _record_modbus_result(True, register)
+        return [dev.block_buffer[r] for r in range(register, register + count)]
+    try:
+        if register in dev.read_errors:
+            raise dev.read_errors[register]
+        try:
+            results = dev.instr.read_registers(register, count)
+        except rtu.InvalidResponseError:
+            # A corrupt frame is line noise, not the register: retry once straight away
+            dev.error_counts["crc"] += 1
+            results = dev.instr.read_registers(register, count)
+    except Exception as e:
+        _record_modbus_result(False, register, e)
+        raise
+    _record_modbus_result(True, register)
+    return results
+
+
+def _read_register(register: int, signed: bool = False) -> int:
+    """Single-register read that is served from the block buffer when possible."""
+    raw = _read_registers(register, 1)[0]
+    if signed and raw >= 0x8000:
+        raw -= 0x10000
+    return raw
+
+
+def _write_register(register: int, value: int):
+    """Single-register write, captured instead of sent while write_batch() runs."""
+    dev = current_device()
+    if dev.write_capture is None:
+        dev.instr.write_register(register, value)
+        return
+    dev.write_capture[register] = value
+    dev.write_touched.add(register)
+
+
+def _read_for_write(register: int) -> int:
+    """Read for a read-modify-write.  A value captured earlier in the same batch is
+    used as is, so several bit changes to one register fold into a single write."""
+    dev = current_device()
+    if dev.write_capture is not None and register in dev.write_capture:
+        return dev.write_capture[register]
+    return dev.instr.read_register(register)
+
+
+# Only registers of the setting areas (P05-P08) are merged into multi-register
+# writes; control registers such as 0xDF00-0xDF0D are written one at a time.
+_MERGE_WRITES_FROM = 0xE000
+_MERGE_WRITES_TO = 0xEFFF
+
+
+def merge_writes(writes: dict[int, int]) -> list[tuple[int, list[int]]]:
+    """Group {register: value} writes into (start, values) runs of consecutive
+    registers, each sent as one FC16 transaction."""
+    runs = []
+    for register in sorted(writes):
+        mergeable = _MERGE_WRITES_FROM <= register <= _MERGE_WRITES_TO
+        if runs and mergeable:
+            start, values = runs[-1]
+            if _MERGE_WRITES_FROM <= start and start + len(values) == register and len(values) < rtu.MAX_WRITE_REGISTERS:
+                values.append(writes[register])
+                continue
+        runs.append((register, [writes[register]]))
+    return runs
+
+
+def write_batch(calls) -> list:
+    """Run the set functions [(set_function, payload)] for the current device with
+    their register writes captured, then send the writes merged by merge_writes().
+    Several writes to one register (e.g. bits of 0xE04D) become one write of the
+    final value.  Returns each call's result, None for calls whose writes failed."""
+    dev = current_device()
+    dev.write_capture = {}
+    touched = []
+    try:
+        for set_function, payload in calls:
+            dev.write_touched = set()
+            try:
+                result = set_function(payload)
+            except Exception as e:
+                print(f"Write failed: {e}")
+                result = None
+            touched.append((result, dev.write_touched))
+    finally:
+        writes, dev.write_capture = dev.write_capture, None
+
+    failed = set()
+    for start, values in merge_writes(writes):
+        try:
+            dev.instr.write_registers(start, values)
+        except rtu.SlaveExceptionError as e:
+            if len(values) == 1:
+                print(f"Write to 0x{start:04X} rejected: {e}")
+                failed.add(start)
+                continue
+            # The inverter may refuse multi-register writes to some settings
+            debug(f"FC16 write 0x{start:04X}+{len(values)} rejected ({e}) — writing registers one by one")
+            for register, value in zip(range(start, start + len(values)), values):
+                try:
+                    dev.instr.write_register(register, value)
+                except Exception as e:
+                    print(f"Write to 0x{register:04X} failed: {e}")
+                    failed.add(register)
+        except Exception as e:
+            print(f"Write to 0x{start:04X}+{len(values)} failed: {e}")
+            failed.update(range(start, start + len(values)))
+    return [None if registers & failed else result for result, registers in touched]
+
+
+def is_buffered(register: int, count: int = 1) -> bool:
+    """Return True if every register of the span is held in the block buffer."""
+    return all(r in current_device().block_buffer for r in range(register, register + count))
+
+
+def clear_block_buffer():
+    dev = current_device()
+    dev.block_buffer.clear()
+    dev.read_errors.clear()
+
+
+def _rejected(dev: Device, register: int) -> bool:
+    """True if the inverter rejected the register, or the row it belongs to, as
+    an illegal address (by the probe or in answer to a read)."""
+    row = register_map.lookup(register)
+    for start in {register, row.address if row is not None else register}:
+        if start in dev.register_skip_time and dev.last_error.get(start) == "illegal_address":
+            return True
+    return False
+
+
+def _bridgeable(first: int, end: int) -> bool:
+    """True if one block read may cover registers first .. end - 1: the table
+    defines them on one page and the inverter has not rejected any of them."""
+    dev = current_device()
+    return register_map.defined(first, end) and not any(_rejected(dev, r) for r in range(first, end))
+
+
+def plan_blocks(spans) -> list[tuple[int, int]]:
+    """Group (register, count) spans into (start, count) block reads.
+
+    Spans separated by at most MODBUS_BLOCK_GAP unused registers are merged as long
+    as the block stays within MODBUS_BLOCK_MAX registers, on one register page, and
+    the registers bridged are defined in the register table and not rejected by
+    the inverter (an undefined or unsupported one makes it reject the whole block).  Only blocks covering two or more spans
+    are returned; the caller reads the remaining spans on their own."""
+    import time as _time
+    now = _time.time()
+    dev = current_device()
+    unblockable = dev.unblockable
+    for expiring in (unblockable, dev.block_breaks):
+        for register in [r for r, ts in expiring.items() if now - ts >= _REGISTER_RETRY_INTERVAL]:
+            del expiring[register]
+
+    blocks = []
+    start = end = previous = None
+    members = 0
+    for register, count in sorted(set(spans)):
+        if register in unblockable or count > _BLOCK_MAX_REGISTERS or _rejected(dev, register):
+            continue
+        if (
+            start is not None
+            and register - end <= _BLOCK_MAX_GAP
+            and max(end, register + count) - start <= _BLOCK_MAX_REGISTERS
+            and previous not in dev.block_breaks
+            and _bridgeable(end - 1, register + 1)
+        ):
+            end = max(end, register + count)
+            members += 1
+            previous = register
+            continue
+        if members > 1:
+            blocks.append((start, end - start))
+        start, end, members = register, register + count, 1
+        previous = register
+    if members > 1:
+        blocks.append((start, end - start))
+    return blocks
+
+
+async def prefetch(spans, priorities: dict | None = None) -> set:
+    """Fetch the given (register, count) spans into the block buffer while the bus
+    budget allows, coalescing adjacent spans via plan_blocks().
+
+    priorities maps a span to its priority class (an index into
+    scheduler.PRIORITY_CLASSES, telemetry by default).  Reads are issued highest
+    class first, a block counting as the highest class among its members, and
+    each only if the bus budget has room for its class.
+
+    A block the inverter rejects with an illegal-address exception covers an
+    address the firmware does not implement.  It is bisected the way the probe
+    does, so the runs of spans on either side stay coalesced, and the point
+    where the rejected address lies (between two halves that were both read) is
+    remembered in block_breaks for the next sweeps.
+    A block that fails otherwise (timeout, CRC) marks its member spans as
+    unblockable and they are retried individually.  A failed single-span read is
+    stored so the helper decoding that span reports it as its own failure.
+    Returns the spans that were attempted; the rest did not fit in the bus budget."""
+    import time as _time
+    dev = current_device()
+    budget = dev.bus.budget
+    priorities = priorities or {}
+    spans = sorted(set(spans))
+    work = []
+    covered = set()
+    for start, count in plan_blocks(spans):
+        members = [s for s in spans if start <= s[0] and s[0] + s[1] <= start + count]
+        covered.update(members)
+        work.append((start, count, members))
+    work.extend((register, count, [(register, count)]) for register, count in spans if (register, count) not in covered)
+
+    def block(members) -> tuple:
+        start = members[0][0]
+        return start, max(register + n for register, n in members) - start, members
+
+    # Halves of rejected blocks, by their first span: [halves outstanding,
+    # whether one of them failed, the span the block was split after]
+    splits: dict = {}
+
+    def settle(members, failed: bool):
+        split = splits.pop(members[0], None)
+        if split is None:
+            return
+        split[0] -= 1
+        split[1] = split[1] or failed
+        if split[0] == 0 and not split[1]:
+            # Both halves were read: the address the block was rejected for lies between them
+            dev.block_breaks[split[2]] = _time.time()
+
+    def priority(members) -> int:
+        return min(priorities.get(span, 0) for span in members)
+
+    work.sort(key=lambda item: priority(item[2]))
+    attempted = set()
+
+    async def worker():
+        while work:
+            start, count, members = work[0]
+            if not budget.allows(priority(members)):
+                return
+            work.pop(0)
+            try:
+                try:
+                    results = await dev.client.read_registers(start, count)
+                except rtu.InvalidResponseError:
+                    dev.error_counts["crc"] += 1
+                    results = await dev.client.read_registers(start, count)
+            except Exception as e:
+                if len(members) > 1:
+                    _record_modbus_result(False, error=e)
+                    settle(members, True)
+                    if classify_error(e) == "illegal_address":
+                        debug(f"Block read 0x{start:04X}+{count} rejected ({e}) — splitting it")
+                        half = len(members) // 2
+                        split = [2, False, members[half - 1][0]]
+                        splits[members[0]] = splits[members[half]] = split
+                        work[0:0] = [block(members[:half]), block(members[half:])]
+                        continue
+                    debug(f"Block read 0x{start:04X}+{count} failed ({e}) — falling back to single reads")
+                    for span in members:
+                        dev.unblockable[span[0]] = _time.time()
+                    work[0:0] = [(register, n, [(register, n)]) for register, n in members]
+                    continue
+                settle(members, True)
+                dev.read_errors[start] = e
+            else:
+                settle(members, False)
+                if len(members) > 1:
+                    _record_modbus_result(True)
+                dev.block_buffer.update(zip(range(start, start + count), results))
+            attempted.update(members)
+
+    # Transports that match responses to requests (Modbus TCP) keep several
+    # reads in flight; serial buses run them one at a time.
+    await asyncio.gather(*(worker() for _ in range(dev.client.transport.pipeline_depth)))
+    return attempted
+
+
 def write_restore_factory_setting(value):
     # Register 0xDF02  CmdRestoreFactorySetting
     # 1: Restore Factory Setting
@@ -134,19 +641,19 @@ def write_restore_factory_setting(value):
     # This seems like a bad idea to enable
     # if value == "1":
     #    try:
-    #        instr.write_register(0xDF02, 0xAA)
+    #        current_device().instr.write_register(0xDF02, 0xAA)
     #    except:
     #        return None
     #    debug("Restore Factory Setting")
     if value == "2":
         try:
-            instr.write_register(0xDF02, 0xBB)
+            _write_register(0xDF02, 0xBB)
         except:
             return None
         debug("Clear statistics")
     elif value == "3":
         try:
-            instr.write_register(0xDF02, 0xCC)
+            _write_register(0xDF02, 0xCC)
         except:
             return None
         debug("Clear errors")
@@ -161,25 +668,44 @@ def read_battery_rate_voltage():
     # most inverter cannot do all voltages 12v/24V/36v/48v
     # This data need to be pulled on start to configure other configuration
     try:
-        result = instr.read_register(0xE003)
+        result = _read_register(0xE003)
     except:
         return None
     debug(f"Battery Rate Voltage: {result}V")
     return result
 
 
-_batt_rate_voltage = read_battery_rate_voltage()
-if _batt_rate_voltage is None:
-    print("WARNING: could not read battery rate voltage; defaulting to 48 V")
-    _batt_rate_voltage = 48
-battery_rate: float = _batt_rate_voltage / 12
+# Registers identify() reads: app and bootloader version, model, serial number
+# and battery rate voltage
+_IDENTITY_SPANS: tuple = ((0x0014, 2), (0x001B, 1), (0x0035, 20), (0xE003, 1))
+
+
+async def identify():
+    """Read what the config of the current device depends on, in one prefetch
+    at start-up instead of blocking reads while the modules are imported."""
+    dev = current_device()
+    await prefetch(_IDENTITY_SPANS)
+    try:
+        dev.serial_number = read_register_str(0x035, "Serial Number", clean=True)
+        dev.model = read_register_value(0x01B, "Model", integer=True)
+        try:
+            dev.firmware = tuple(_read_registers(0x0014, 2))
+        except:
+            dev.firmware = None
+        batt_rate_voltage = read_battery_rate_voltage()
+    finally:
+        clear_block_buffer()
+    if batt_rate_voltage is None:
+        print(f"WARNING: could not read battery rate voltage of {dev.name}; defaulting to 48 V")
+        batt_rate_voltage = 48
+    dev.battery_rate = batt_rate_voltage / 12
 
 
 def read_errors():
     # Register 0xF800  FaultHistoryRecord00
     for i in range(32):
         try:
-            results = instr.read_registers(0xF800 + (0x10 * i), 16)
+            results = current_device().instr.read_registers(0xF800 + (0x10 * i), 16)
         except:
             return None
 
@@ -216,9 +742,15 @@ def _format_scaled(result: float, scale: float) -> str:
     return f"{result:.{decimals}f}"
 
 
+def decode_str(registers: list[int]) -> str:
+    """String packed two characters per register, high byte first (latin-1, like
+    minimalmodbus read_string, so a byte >= 0x80 does not fail the read)."""
+    return bytes(b for raw in registers for b in (raw >> 8, raw & 0xFF)).decode("latin-1")
+
+
 def read_register_str(register: int, name: str = "", clean: bool = False, prefix: str = ""):
     try:
-        result = instr.read_string(register, 20)
+        result = decode_str(_read_registers(register, 20))
     except:
         return None
     if clean:
@@ -243,11 +775,9 @@ def read_register_value(
     if not is_register_available(register):
         return None
     try:
-        result = instr.read_register(register, signed=signed)
+        result = _read_register(register, signed=signed)
     except:
-        _record_modbus_result(False, register)
         return None
-    _record_modbus_result(True, register)
     result = float(result) * scale
     if format_str:
         if integer:
@@ -274,11 +804,9 @@ def read_clamped_register(register: int, scale: float = 1.0, name: str = "") ->
     if not is_register_available(register):
         return None
     try:
-        result = max(0, instr.read_register(register, signed=True))
+        result = max(0, _read_register(register, signed=True))
     except:
-        _record_modbus_result(False, register)
         return None
-    _record_modbus_result(True, register)
     result = float(result) * scale
     value = _format_scaled(result, scale)
     if name:
@@ -293,7 +821,7 @@ def write_register_value(register: int, value: str, scale: float = 1.0) -> bool
         return None
     try:
         raw = int(round(float(value) / scale))
-        instr.write_register(register, raw)
+        _write_register(register, raw)
     except:
         return None
     return True
@@ -302,13 +830,13 @@ def write_register_value(register: int, value: str, scale: float = 1.0) -> bool
 def read_battery_voltage_register(register: int, name: str = "") -> str | None:
     """Read a battery voltage register. Raw register value = actual_volts * 10 / battery_rate.
     Returns the actual voltage as a formatted string."""
-    return read_register_value(register, name=name, scale=battery_rate / 10)
+    return read_register_value(register, name=name, scale=current_device().battery_rate / 10)
 
 
 def write_battery_voltage_register(register: int, value: str) -> bool | None:
     """Write a battery voltage register. Raw register value = actual_volts * 10 / battery_rate.
     Accepts the actual voltage as a human-readable string."""
-    return write_register_value(register, value, scale=battery_rate / 10)
+    return write_register_value(register, value, scale=current_device().battery_rate / 10)
 
 
 ############ Parallel Inverter Power Sums (P02 0x024E-0x0254) #####################
@@ -317,7 +845,7 @@ def write_battery_voltage_register(register: int, value: str) -> bool | None:
 def read_parallel_load_active_power_sum() -> int | None:
     # Register 0x024E  ParaUpsLoadPowersum – sum of UPS/load active power across all parallel units
     try:
-        return instr.read_register(0x024E, signed=True)
+        return _read_register(0x024E, signed=True)
     except:
         return None
 
@@ -325,7 +853,7 @@ def read_parallel_load_active_power_sum() -> int | None:
 def read_parallel_home_active_power_sum() -> int | None:
     # Register 0x0250  ParaHomeLoadPowerSum – sum of home-load active power across all parallel units
     try:
-        return instr.read_register(0x0250)
+        return _read_register(0x0250)
     except:
         return None
 
@@ -333,7 +861,7 @@ def read_parallel_home_active_power_sum() -> int | None:
 def read_parallel_grid_active_power_sum() -> int | None:
     # Register 0x0252  ParaGridPowerSum – positive = consuming from grid, negative = exporting
     try:
-        return -instr.read_register(0x0252, signed=True)
+        return -_read_register(0x0252, signed=True)
     except:
         return None
 
@@ -372,7 +900,7 @@ def read_lookup_register(register: int, lookup: dict, name: str = "") -> str | N
     """Read a register and return the human-readable string from the lookup dict.
     Falls back to the raw integer string if the value is not in the dict."""
     try:
-        result = instr.read_register(register)
+        result = _read_register(register)
     except:
         return None
     value = lookup.get(result, str(result))
@@ -388,7 +916,7 @@ def write_lookup_register(register: int, lookup: dict, value: str) -> bool | Non
     if value not in reverse:
         return None
     try:
-        instr.write_register(register, reverse[value])
+        _write_register(register, reverse[value])
     except:
         return None
     return True
@@ -396,7 +924,7 @@ def write_lookup_register(register: int, lookup: dict, value: str) -> bool | Non
 def read_time_register(register: int, name: str = "") -> str | None:
     """Read a time register packed as (hours << 8) | minutes. Returns 'HH:MM'."""
     try:
-        result = instr.read_register(register)
+        result = _read_register(register)
     except:
         return None
     hours   = (result >> 8) & 0xFF
@@ -411,7 +939,7 @@ def write_time_register(register: int, value: str) -> bool | None:
     """Write a time register packed as (hours << 8) | minutes. Accepts 'HH:MM'."""
     try:
         hours, minutes = map(int, value.split(":"))
-        instr.write_register(register, (hours << 8) | minutes)
+        _write_register(register, (hours << 8) | minutes)
     except:
         return None
     return True
@@ -431,7 +959,7 @@ def read_bit_register(register: int, bit: int, name: str = "") -> str | None:
     """Read a single bit from a register. Returns 'Enabled' (1) or 'Disabled' (0).
     Performs a full register read; use for packed bit-field registers like TimedChgSource."""
     try:
-        result = instr.read_register(register)
+        result = _read_register(register)
     except:
         return None
     value = "Enabled" if (result >> bit) & 1 else "Disabled"
@@ -444,12 +972,12 @@ def write_bit_register(register: int, bit: int, value: str) -> bool | None:
     """Set or clear a single bit in a register via read-modify-write.
     Accepts 'Enabled' (sets the bit) or 'Disabled' (clears the bit)."""
     try:
-        raw = instr.read_register(register)
+        raw = _read_for_write(register)
         if value == "Enabled":
             raw |= (1 << bit)
         else:
             raw &= ~(1 << bit)
-        instr.write_register(register, raw)
+        _write_register(register, raw)
     except:
         return None
     return True
@@ -461,11 +989,10 @@ def read_long_register(register: int, scale: float = 1.0, name: str = "") -> str
     if not is_register_available(register):
         return None
     try:
-        result = instr.read_long(register, byteorder=minimalmodbus.BYTEORDER_LITTLE_SWAP)
+        low, high = _read_registers(register, 2)
+        result = low | (high << 16)
     except:
-        _record_modbus_result(False, register)
         return None
-    _record_modbus_result(True, register)
     result = float(result) * scale
     value = _format_scaled(result, scale)
     if name:
@@ -480,11 +1007,9 @@ def read_datetime_register(register: int, name: str = "") -> str | None:
     if not is_register_available(register):
         return None
     try:
-        results = instr.read_registers(register, 3)
+        results = _read_registers(register, 3)
     except:
-        _record_modbus_result(False, register)
         return None
-    _record_modbus_result(True, register)
     year   = (results[0] >> 8) & 0xFF
     month  =  results[0]       & 0xFF
     day    = (results[1] >> 8) & 0xFF
@@ -496,35 +1021,59 @@ def read_datetime_register(register: int, name: str = "") -> str | None:
         debug(f"{name}: {value}")
     return value
 
-def write_system_date_time():
-    # Get the current system date and time using datetime.now()
+# Number of consecutive registers each multi-register read helper consumes;
+# every other helper reads a single register.
+_HELPER_SPANS: dict = {
+    read_register_str: 20,
+    read_long_register: 2,
+    read_datetime_register: 3,
+}
+
 
+def register_span(read_fn, args: dict) -> tuple[int, int] | None:
+    """Return the (register, count) span an mqtt_config read entry touches, or None
+    if the entry does not address a register directly."""
+    register = args.get("register")
+    if register is None:
+        return None
+    return register, _HELPER_SPANS.get(read_fn, 1)
+
+
+def system_date_time_registers() -> list[int]:
+    """Host clock (in TIMEZONE if set) packed as the three SRNE datetime registers
+    at 0x020C: [year|month, day|hour, minute|second]."""
     tz = os.getenv("TIMEZONE")
     timezone = pytz.timezone(tz) if tz else None
     now = datetime.now(timezone)
 
     year = now.year - 2000  # Convert the year to match the expected format
-    month = now.month
-    day = now.day
-    hour = now.hour
-    minute = now.minute
-    second = now.second
-
-    data = [
-        int(year << 8) + int(month),
-        int(day << 8) + int(hour),
-        int(minute << 8) + int(second),
+    debug(f"System Date/Time: {now.strftime('%Y-%m-%d %H:%M:%S')}")
+    return [
+        int(year << 8) + int(now.month),
+        int(now.day << 8) + int(now.hour),
+        int(now.minute << 8) + int(now.second),
     ]
+
+
+def write_system_date_time():
     try:
-        instr.write_registers(0x20C, data)
+        current_device().instr.write_registers(0x20C, system_date_time_registers())
     except:
         return None
-    debug(f"System Date/Time: {now.strftime('%Y-%m-%d %H:%M:%S')}")
+    return True
+
+
+async def write_system_date_time_async():
+    try:
+        await current_device().client.write_registers(0x20C, system_date_time_registers())
+    except Exception:
+        return None
+    return True
 
 
 def read_failcode(register: int, name: str):
     try:
-        result = instr.read_register(register)
+        result = _read_register(register)
     except:
         return None
 
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Predict whether an interval profile fits on the Modbus bus.
+
+Usage:
+    python3 plan_capacity.py [--env profile.env] [--set NAME=VALUE ...]
+                             [--calibrate timings.csv] [--no-coalesce] [--json]
+
+Loads mqtt_topic_config under the given environment (entries switched off by
+PARALLEL, SPLIT_PHASE, NB_MPPT_TRACKERS, PUBLISH_SYSTEM etc. are left out) without
+opening the Modbus device, prices every poll with a transaction cost model and
+reports the predicted bus utilization, the worst-case staleness of each interval
+group and the entries that will miss their interval.
+
+Cost model, per read transaction:
+    request (8 bytes) + response (5 + 2 x registers bytes) at 10 bits per byte,
+    3.5 character times of silence after each frame, and the inverter's
+    turnaround time (--turnaround, or per register page from --calibrate).
+
+--calibrate takes recorded timings, one transaction per line:
+    register,count,seconds
+where seconds is the time from sending the request to receiving the response,
+or a capture written with MODBUS_CAPTURE (see capture.py).
+The wire time is subtracted and the median of the rest is the turnaround of
+each register page (register & 0xFF00).
+"""
+
+import os
+import sys
+import json
+import statistics
+
+# Interval settings of mqtt_topic_config, in the order groups are listed
+GROUP_INTERVALS: tuple = (
+    "pv_interval",
+    "battery_interval",
+    "load_interval",
+    "grid_interval",
+    "inverter_interval",
+    "temperature_interval",
+    "general_interval",
+    "statistics_interval",
+    "system_interval",
+)
+
+_REQUEST_BYTES = 8
+_SILENCE_CHARS = 3.5
+
+
+class CostModel:
+    """Seconds of bus time a read transaction takes at a given baud rate."""
+
+    def __init__(self, baudrate: int, turnaround: float, pages: dict[int, float] | None = None):
+        self.baudrate = baudrate
+        self.turnaround = turnaround
+        self.pages = pages or {}
+
+    def char_time(self) -> float:
+        return 10 / self.baudrate
+
+    def wire_time(self, count: int) -> float:
+        return (_REQUEST_BYTES + 5 + 2 * count + 2 * _SILENCE_CHARS) * self.char_time()
+
+    def read_cost(self, register: int, count: int) -> float:
+        return self.wire_time(count) + self.pages.get(register & 0xFF00, self.turnaround)
+
+    @classmethod
+    def calibrated(cls, path: str, baudrate: int, turnaround: float) -> "CostModel":
+        model = cls(baudrate, turnaround)
+        samples: dict[int, list[float]] = {}
+        for register, count, seconds in _read_timings(path):
+            samples.setdefault(register & 0xFF00, []).append(max(0.0, seconds - model.wire_time(count)))
+        if not samples:
+            raise ValueError(f"no timings in {path}")
+        model.pages = {page: statistics.median(values) for page, values in samples.items()}
+        model.turnaround = statistics.median([t for values in samples.values() for t in values])
+        return model
+
+
+def _read_timings(path: str):
+    """(register, count, seconds) from a timings CSV or a MODBUS_CAPTURE file."""
+    import capture
+    with open(path, "rb") as f:
+        if f.read(len(capture.MAGIC)) == capture.MAGIC:
+            yield from capture.timings(path)
+            return
+    with open(path) as f:
+        for line in f:
+            line = line.split("#")[0].strip()
+            if not line:
+                continue
+            try:
+                register, count, seconds = (field.strip() for field in line.split(","))
+                yield int(register, 0), int(count), float(seconds)
+            except ValueError:
+                print(f"Ignoring malformed timing: {line}", file=sys.stderr)
+
+
+def _apply_env(env_file: str | None, overrides: list[str]):
+    """Environment the config is evaluated under: the profile, then --set
+    overrides, with the Modbus device blanked so nothing touches the bus."""
+    from dotenv import load_dotenv
+    if env_file:
+        load_dotenv(env_file, override=True)
+    for item in overrides:
+        name, _, value = item.partition("=")
+        os.environ[name.strip()] = value.strip()
+    os.environ["MODBUS_DEVICE"] = ""
+    os.environ["MODBUS_ADDRESS"] = os.getenv("MODBUS_ADDRESS", "1").split(",")[0]
+
+
+def plan(config, model: CostModel, occupancy: float, coalesce: bool = True) -> dict:
+    """Predict the bus load of every interval group of a loaded mqtt_topic_config."""
+    import modbus
+    from scheduler import PRIORITY_CLASSES, priority_class
+
+    labels: dict[float, str] = {}
+    for attr in GROUP_INTERVALS:
+        interval = getattr(config, attr)
+        name = attr.replace("_interval", "")
+        labels[interval] = f"{labels[interval]}/{name}" if interval in labels else name
+
+    # A register is fetched once for every entry decoding it, at the fastest of their intervals
+    span_interval: dict[tuple, float] = {}
+    entries = []
+    for name, vals in config.mqtt_config.items():
+        if not vals.get("enabled", True) or vals.get("topic_type", "sensor") == "button":
+            continue
+        interval = vals.get("interval") or 0
+        span = modbus.register_span(vals["value"], vals["args"]) if "args" in vals else None
+        entries.append((name, interval, priority_class(config, name, vals), span))
+        if span is not None and interval > 0:
+            span_interval[span] = min(span_interval.get(span, interval), interval)
+
+    groups: dict[tuple, dict] = {}
+    for name, interval, priority, span in entries:
+        if interval <= 0:
+            continue
+        key = (priority, interval)
+        group = groups.setdefault(key, {
+            "group": labels.get(interval, f"{interval:g}s"),
+            "class": PRIORITY_CLASSES[priority],
+            "interval": interval,
+            "entries": [],
+            "spans": set(),
+        })
+        group["entries"].append(name)
+        if span is not None and span_interval[span] == interval:
+            group["spans"].add(span)
+
+    # Reads of a group are priced as if its entries fall due together, which is
+    # when coalescing helps most; --no-coalesce gives the one-read-per-span bound.
+    for group in groups.values():
+        spans = sorted(group.pop("spans"))
+        blocks = modbus.plan_blocks(spans) if coalesce else []
+        covered = {s for start, count in blocks for s in spans if start <= s[0] and s[0] + s[1] <= start + count}
+        reads = blocks + [s for s in spans if s not in covered]
+        group["transactions"] = len(reads)
+        group["sweep"] = sum(model.read_cost(register, count) for register, count in reads)
+        group["utilization"] = group["sweep"] / group["interval"]
+
+    # The bus serves classes in priority order within the occupancy budget: a
+    # group keeps up only if its class and every class above it fit together.
+    ordered = sorted(groups.values(), key=lambda g: (PRIORITY_CLASSES.index(g["class"]), g["interval"]))
+    for group in ordered:
+        rank = PRIORITY_CLASSES.index(group["class"])
+        above = [g for g in ordered if PRIORITY_CLASSES.index(g["class"]) <= rank]
+        load = sum(g["utilization"] for g in above)
+        backlog = sum(g["sweep"] for g in above)
+        group["fits"] = load <= occupancy
+        group["staleness"] = group["interval"] + backlog / occupancy if group["fits"] else None
+
+    total = sum(g["utilization"] for g in ordered)
+    return {
+        "baudrate": model.baudrate,
+        "turnaround": model.turnaround,
+        "occupancy_budget": occupancy,
+        "coalesce": coalesce,
+        "utilization": total,
+        "fits": total <= occupancy,
+        "groups": [{**g, "entries": len(g["entries"])} for g in ordered],
+        "missing": sorted(name for g in ordered if not g["fits"] for name in g["entries"]),
+    }
+
+
+def print_report(report: dict):
+    print(
+        f"Bus: {report['baudrate']} baud, turnaround {report['turnaround'] * 1000:.0f} ms, "
+        f"block coalescing {'on' if report['coalesce'] else 'off'}"
+    )
+    print(f"Predicted utilization: {report['utilization'] * 100:.1f}% of bus time "
+          f"(budget {report['occupancy_budget'] * 100:.0f}%)")
+    print()
+    print(f"{'group':<28} {'class':<11} {'interval':>9} {'entries':>8} {'reads':>6} {'sweep':>8} {'util':>7} {'worst stale':>12}")
+    for g in report["groups"]:
+        stale = f"{g['staleness']:.1f}s" if g["staleness"] is not None else "unbounded"
+        print(
+            f"{g['group']:<28} {g['class']:<11} {g['interval']:>8g}s {g['entries']:>8} {g['transactions']:>6} "
+            f"{g['sweep']:>7.2f}s {g['utilization'] * 100:>6.1f}% {stale:>12}"
+        )
+    print()
+    if report["missing"]:
+        print(f"{len(report['missing'])} entries will miss their interval:")
+        for name in report["missing"]:
+            print(f"  {name}")
+    else:
+        print("Every entry fits within its interval.")
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--env", default=None, help="Interval profile to evaluate (default: .env)")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE", help="Override one setting; repeatable")
+    parser.add_argument("--baudrate", type=int, default=None, help="Bus baud rate (default: MODBUS_BAUDRATE)")
+    parser.add_argument("--turnaround", type=float, default=0.03, help="Inverter response time in seconds (default: 0.03)")
+    parser.add_argument("--calibrate", default=None, metavar="FILE", help="Recorded register,count,seconds timings or a frame capture")
+    parser.add_argument("--occupancy", type=float, default=None, help="Bus occupancy budget in percent (default: MODBUS_BUS_OCCUPANCY)")
+    parser.add_argument("--no-coalesce", action="store_true", help="Price one transaction per register span")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    _apply_env(args.env, args.set)
+    # Printing from the config import (device set-up, failed identity reads) goes to stderr
+    stdout, sys.stdout = sys.stdout, sys.stderr
+    try:
+        import modbus
+        import mqtt_topic_config
+    finally:
+        sys.stdout = stdout
+
+    baudrate = args.baudrate or modbus.modbus_baudrate
+    if args.calibrate:
+        model = CostModel.calibrated(args.calibrate, baudrate, args.turnaround)
+    else:
+        model = CostModel(baudrate, args.turnaround)
+    occupancy = args.occupancy / 100 if args.occupancy is not None else modbus._BUS_OCCUPANCY
+
+    report = plan(mqtt_topic_config, model, occupancy, coalesce=not args.no_coalesce)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    sys.exit(0 if report["fits"] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Start-up probe of the registers an inverter implements.
+
+Instead of discovering unsupported registers one failed read at a time, the
+probe reads each register page in blocks and bisects the blocks the inverter
+rejects, so k unsupported registers among n cost O(k log n) transactions.
+
+Results are cached per inverter identity (serial number plus app and
+bootloader versions), so a restart of the same unit does not probe again while
+a swapped unit or a firmware upgrade does."""
+
+import os
+import json
+import time
+from dotenv import load_dotenv
+import modbus
+import register_map
+import rtu
+
+load_dotenv()
+
+probe_enabled: bool = os.getenv("MODBUS_PROBE", "true") == "true"
+_CACHE_FILE: str = os.getenv("MODBUS_CAPABILITY_CACHE", "capability_cache.json")
+
+# Register pages of docs/register_table.txt: (page, first register, last register).
+# Blocks never cross a page boundary.
+PAGES: list = register_map.PAGES
+
+
+async def probe(spans) -> tuple[dict[int, bool], int]:
+    """Probe the (register, count) spans on the current device.  Returns the
+    capability map {start register: supported} and the number of transactions.
+
+    A span is unsupported when the inverter answers a read of it alone with an
+    "Illegal Data Address" exception.  Spans whose reads time out or fail for
+    other reasons get no verdict and are left to normal polling."""
+    dev = modbus.current_device()
+    capabilities: dict[int, bool] = {}
+    transactions = 0
+
+    async def check(members: list):
+        nonlocal transactions
+        start = members[0][0]
+        count = max(register + n for register, n in members) - start
+        transactions += 1
+        try:
+            await dev.client.read_registers(start, count)
+        except rtu.SlaveExceptionError as e:
+            if len(members) > 1:
+                half = len(members) // 2
+                await check(members[:half])
+                await check(members[half:])
+            elif e.code == 2:
+                capabilities[start] = False
+            return
+        except Exception as e:
+            modbus.debug(f"Probe of 0x{start:04X}+{count} on {dev.name} failed: {e}")
+            return
+        for register, _ in members:
+            capabilities[register] = True
+
+    spans = sorted(set(spans))
+    for _, first, last in PAGES:
+        block = []
+        for span in (s for s in spans if first <= s[0] <= last):
+            if block and span[0] + span[1] - block[0][0] > rtu.MAX_READ_REGISTERS:
+                await check(block)
+                block = []
+            block.append(span)
+        if block:
+            await check(block)
+    return capabilities, transactions
+
+
+def read_identity() -> str | None:
+    """'serial/app version/bootloader version' of the current device, as read
+    by modbus.identify(), or None if it could not be read."""
+    dev = modbus.current_device()
+    if not dev.serial_number or dev.firmware is None:
+        print(f"Could not read identity of {dev.name}")
+        return None
+    serial = dev.serial_number.strip()
+    app, bootloader = dev.firmware
+    return f"{serial}/{app}/{bootloader}" if serial else None
+
+
+def _load_cache() -> dict:
+    try:
+        with open(_CACHE_FILE) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"Could not load capability cache: {e}")
+        return {}
+
+
+def _save_cache(cache: dict):
+    try:
+        with open(_CACHE_FILE, "w") as f:
+            json.dump(cache, f, indent=2)
+    except Exception as e:
+        print(f"Could not save capability cache: {e}")
+
+
+async def probe_device(spans):
+    """Find out which of the spans the current device supports and apply the
+    result to its skip state, so discovery is only published for registers the
+    inverter implements.  Spans already known for this inverter's identity are
+    taken from the capability cache; only the rest are probed."""
+    dev = modbus.current_device()
+    started = time.monotonic()
+    identity = read_identity()
+    cache = _load_cache()
+    entry = cache.get(identity, {}) if identity else {}
+    known: dict[int, bool] = {int(r, 16): True for r in entry.get("supported", [])}
+    known.update({int(r, 16): False for r in entry.get("unsupported", [])})
+
+    missing = sorted(span for span in set(spans) if span[0] not in known)
+    transactions = 0
+    if missing:
+        capabilities, transactions = await probe(missing)
+        known.update(capabilities)
+        if identity and not dev.bus.replay:
+            cache[identity] = {
+                "probed": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "supported": [f"0x{r:04X}" for r in sorted(known) if known[r]],
+                "unsupported": [f"0x{r:04X}" for r in sorted(known) if not known[r]],
+            }
+            _save_cache(cache)
+    modbus.apply_capabilities(known)
+
+    unsupported = sorted(register for register, supported in known.items() if not supported)
+    source = f"probed in {transactions} transactions" if missing else "from capability cache"
+    print(
+        f"Capabilities of {dev.name} ({identity or 'unknown identity'}): {len(known) - len(unsupported)} supported, "
+        f"{len(unsupported)} unsupported, {source} ({time.monotonic() - started:.1f}s)"
+    )
+    if unsupported:
+        debug_list = ", ".join(f"0x{register:04X}" for register in unsupported)
+        modbus.debug(f"Unsupported registers on {dev.name}: {debug_list}")
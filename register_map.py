@@ -0,0 +1,131 @@
+"""Register metadata index, parsed from docs/register_table.txt.
+
+The table of the SRNE protocol document lists every register with its length,
+access, magnification (scale), unit, display format, signedness and, for
+settings, its minimum, maximum and default.  This module parses it once at
+import into Register records indexed by address, with the pages (P00 - P10)
+they belong to, so scale, sign and bounds come from one place:
+
+    entity_map      fills in the scale and sign of read and write helpers
+    entities        takes the bounds of number entities without min/max
+    modbus          only bridges gaps between registers the table defines,
+                    and never across a page, when coalescing block reads
+    probe           probes page by page
+    simulator       serves the table as its register contents
+"""
+
+import os
+import re
+import math
+import hashlib
+
+TABLE: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "docs", "register_table.txt")
+
+# One register row of the table.  Rows commented out a second time ("# #") are
+# reserved registers: they exist but carry no data.
+_ROW = re.compile(
+    r"^#\s+(?P<reserved>#\s+)?(?P<address>[0-9A-F]{4})\s+(?P<length>\d+)\s+(?P<name>.+?)\s*(?P<access>RW|R|W)"
+    r"\s+(?P<magnification>[\d.]+)\s+(?:(?P<unit>\S+)\s+)??(?P<format>%\S*)\s+(?P<sign>Signed|Unsigned)"
+    r"(?:\s+(?P<minimum>-?[\d.]+)\s+(?P<maximum>-?[\d.]+)\s+(?P<default>-?[\d.]+)(?=\s|$))?"
+)
+# Heading of a register page, e.g. "# P01 DC Data Area"
+_PAGE = re.compile(r"^#\s+(?P<page>P\d\d)\s")
+
+
+class Register:
+    """One row of the register table."""
+
+    __slots__ = (
+        "address", "length", "name", "access", "scale", "unit", "format",
+        "signed", "minimum", "maximum", "default", "reserved", "page",
+    )
+
+    def __init__(self, row: dict, page: str | None):
+        self.address: int = int(row["address"], 16)
+        self.length: int = int(row["length"])
+        self.name: str = row["name"].strip()
+        self.access: str = row["access"]
+        self.scale: float = float(row["magnification"])
+        self.unit: str = "" if row["unit"] in (None, "-") else row["unit"]
+        self.format: str = row["format"]
+        self.signed: bool = row["sign"] == "Signed"
+        # Bounds and default are in display units, i.e. after scaling
+        self.minimum: float | None = float(row["minimum"]) if row["minimum"] else None
+        self.maximum: float | None = float(row["maximum"]) if row["maximum"] else None
+        self.default: float | None = float(row["default"]) if row["default"] else None
+        self.reserved: bool = bool(row["reserved"])
+        self.page = page
+
+    def __repr__(self):
+        return f"Register(0x{self.address:04X}+{self.length} {self.name} {self.page})"
+
+
+def load_table(path: str = TABLE) -> list[Register]:
+    """Register rows of the table, in table order."""
+    rows = []
+    page = None
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            match = _ROW.match(line)
+            if match:
+                rows.append(Register(match.groupdict(), page))
+                continue
+            match = _PAGE.match(line)
+            if match:
+                page = match.group("page")
+    return rows
+
+
+def build_index(rows: list[Register]) -> dict[int, Register]:
+    """Row of every address the rows cover.  Where the table lists an address
+    twice, the later row wins."""
+    index = {}
+    for row in rows:
+        for register in range(row.address, row.address + row.length):
+            index[register] = row
+    return index
+
+
+def build_pages(rows: list[Register]) -> list[tuple[str, int, int]]:
+    """(page, first register, last register) of every page, a page starting at
+    its 256-register boundary."""
+    bounds: dict[str, list] = {}
+    for row in rows:
+        first, last = bounds.setdefault(row.page, [row.address & 0xFF00, row.address])
+        bounds[row.page][1] = max(last, row.address + row.length - 1)
+    return [(page, first, last) for page, (first, last) in bounds.items()]
+
+
+REGISTERS: list[Register] = load_table()
+INDEX: dict[int, Register] = build_index(REGISTERS)
+PAGES: list[tuple[str, int, int]] = build_pages(REGISTERS)
+
+with open(TABLE, "rb") as _f:
+    # Part of the key of compiled data derived from the table (entity_map cache)
+    FINGERPRINT: str = hashlib.sha256(_f.read()).hexdigest()
+
+
+def lookup(register: int) -> Register | None:
+    """Row covering the register, or None if the table does not define it."""
+    return INDEX.get(register)
+
+
+def page_of(register: int) -> str | None:
+    row = INDEX.get(register)
+    return row.page if row is not None else None
+
+
+def defined(first: int, end: int) -> bool:
+    """True if the table defines every register of first .. end - 1 and they
+    all lie on one page, i.e. one block read may cover them."""
+    page = page_of(first)
+    return page is not None and all(page_of(register) == page for register in range(first + 1, end))
+
+
+def bounds(register: int, scale: float) -> tuple[float | None, float | None]:
+    """Table minimum and maximum of a register decoded with scale, or
+    (None, None) if the table gives none or uses another scale for it."""
+    row = INDEX.get(register)
+    if row is None or row.address != register or not math.isclose(row.scale, scale):
+        return None, None
+    return row.minimum, row.maximum
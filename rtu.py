@@ -0,0 +1,129 @@
+"""Modbus RTU framing shared by the serial and socket transports.
+
+Transports exchange protocol data units (function code + payload); this module
+builds request PDUs, wraps them in RTU frames (slave address + PDU + CRC) and
+validates responses."""
+
+import struct
+
+READ_HOLDING_REGISTERS = 0x03
+WRITE_SINGLE_REGISTER = 0x06
+WRITE_MULTIPLE_REGISTERS = 0x10
+
+MAX_READ_REGISTERS = 125
+MAX_WRITE_REGISTERS = 123
+
+EXCEPTION_CODES: dict = {
+    1: "Illegal Function",
+    2: "Illegal Data Address",
+    3: "Illegal Data Value",
+    4: "Slave Device Failure",
+    5: "Acknowledge",
+    6: "Slave Device Busy",
+    8: "Memory Parity Error",
+    10: "Gateway Path Unavailable",
+    11: "Gateway Target Device Failed To Respond",
+}
+
+
+class ModbusError(Exception):
+    """Base class for every error raised while talking to the inverter."""
+
+
+class NoResponseError(ModbusError):
+    """The slave did not answer within the timeout."""
+
+
+class InvalidResponseError(ModbusError):
+    """The response frame was corrupt: bad CRC, truncated, or not matching the request."""
+
+
+class SlaveExceptionError(ModbusError):
+    """The slave answered with a Modbus exception response."""
+
+    def __init__(self, code: int):
+        self.code = code
+        super().__init__(f"Modbus exception {code}: {EXCEPTION_CODES.get(code, 'Unknown')}")
+
+
+def _crc_table() -> list[int]:
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+_CRC_TABLE = _crc_table()
+
+
+def crc16(data: bytes) -> int:
+    crc = 0xFFFF
+    for byte in data:
+        crc = (crc >> 8) ^ _CRC_TABLE[(crc ^ byte) & 0xFF]
+    return crc
+
+
+def read_pdu(register: int, count: int) -> bytes:
+    if not 1 <= count <= MAX_READ_REGISTERS:
+        raise ValueError(f"cannot read {count} registers in one request")
+    return struct.pack(">BHH", READ_HOLDING_REGISTERS, register, count)
+
+
+def write_pdu(register: int, values: list[int]) -> bytes:
+    """FC16 write of one or more registers.  Values must be unsigned 16-bit."""
+    if not 1 <= len(values) <= MAX_WRITE_REGISTERS:
+        raise ValueError(f"cannot write {len(values)} registers in one request")
+    for value in values:
+        if not 0 <= value <= 0xFFFF:
+            raise ValueError(f"register value {value} out of range")
+    return struct.pack(f">BHHB{len(values)}H", WRITE_MULTIPLE_REGISTERS, register, len(values), 2 * len(values), *values)
+
+
+def response_pdu_length(request: bytes) -> int:
+    """Length of the normal (non-exception) response PDU to a request PDU."""
+    function = request[0]
+    if function == READ_HOLDING_REGISTERS:
+        return 2 + 2 * struct.unpack_from(">H", request, 3)[0]
+    return 5
+
+
+def frame(slave: int, pdu: bytes) -> bytes:
+    adu = bytes([slave]) + pdu
+    return adu + struct.pack("<H", crc16(adu))
+
+
+def expected_frame_length(request: bytes, received: bytes) -> int:
+    """Length of the RTU response frame to expect, given the bytes received so far.
+    Exception responses (function code | 0x80) are always 5 bytes."""
+    if len(received) >= 2 and received[1] & 0x80:
+        return 5
+    return 1 + response_pdu_length(request) + 2
+
+
+def unframe(slave: int, adu: bytes) -> bytes:
+    """Verify an RTU response frame's CRC and slave address and return its PDU."""
+    if len(adu) < 5:
+        raise InvalidResponseError(f"truncated frame: {adu.hex()}")
+    if struct.unpack("<H", adu[-2:])[0] != crc16(adu[:-2]):
+        raise InvalidResponseError(f"CRC mismatch: {adu.hex()}")
+    if adu[0] != slave:
+        raise InvalidResponseError(f"response from slave {adu[0]}, expected {slave}")
+    return adu[1:-2]
+
+
+def check_response(request: bytes, response: bytes) -> bytes:
+    """Raise if a response PDU is an exception or does not answer the request."""
+    if response[0] == request[0] | 0x80:
+        raise SlaveExceptionError(response[1])
+    if response[0] != request[0] or len(response) != response_pdu_length(request):
+        raise InvalidResponseError(f"unexpected response {response.hex()} to {request.hex()}")
+    if request[0] == READ_HOLDING_REGISTERS and response[1] != len(response) - 2:
+        raise InvalidResponseError(f"byte count mismatch in {response.hex()}")
+    return response
+
+
+def decode_registers(response: bytes) -> list[int]:
+    return list(struct.unpack_from(f">{response[1] // 2}H", response, 2))
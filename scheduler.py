@@ -0,0 +1,235 @@
+import heapq
+import time
+
+
+class Scheduler:
+    """Min-heap of next-due times (monotonic clock) for mqtt_config entries.
+
+    Rescheduling an entry pushes a new heap node; superseded nodes are discarded
+    lazily when they reach the top, so every operation is O(log n)."""
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self._heap: list[tuple[float, int, str]] = []
+        self._due: dict[str, float] = {}
+        self._seq = 0
+        # Seconds each entry was serviced after its deadline, as of its last read
+        self.lag: dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def schedule(self, name: str, due: float):
+        """(Re)schedule an entry to fall due at the given monotonic time."""
+        self._due[name] = due
+        self._seq += 1
+        heapq.heappush(self._heap, (due, self._seq, name))
+
+    def schedule_in(self, name: str, delay: float):
+        self.schedule(name, self.clock() + delay)
+
+    def cancel(self, name: str):
+        self._due.pop(name, None)
+
+    def is_scheduled(self, name: str) -> bool:
+        return name in self._due
+
+    def due_at(self, name: str) -> float | None:
+        return self._due.get(name)
+
+    def next_due(self) -> float | None:
+        """Monotonic time of the earliest pending deadline, or None if nothing is scheduled."""
+        heap = self._heap
+        while heap and self._due.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def time_until_next(self) -> float | None:
+        due = self.next_due()
+        if due is None:
+            return None
+        return max(0.0, due - self.clock())
+
+    def pop_due(self) -> list[str]:
+        """Remove and return every entry whose deadline has passed, recording its lag.
+        Callers must reschedule an entry to keep it polling."""
+        now = self.clock()
+        names = []
+        while True:
+            due = self.next_due()
+            if due is None or due > now:
+                break
+            _, _, name = heapq.heappop(self._heap)
+            del self._due[name]
+            self.lag[name] = now - due
+            names.append(name)
+        return names
+
+    def lag_summary(self) -> tuple[float, float]:
+        """Return (max, mean) lag in seconds across all entries read so far."""
+        if not self.lag:
+            return 0.0, 0.0
+        lags = self.lag.values()
+        return max(lags), sum(lags) / len(lags)
+
+
+class FairShare:
+    """Share bus time between inverters polled over one line (start-time fair queueing).
+
+    Each unit is charged the seconds of bus time its batches took, so a unit whose
+    registers time out pays for its own timeouts.  The ready unit with the least
+    virtual time goes next; a unit coming back from idle starts at the current
+    virtual time instead of cashing in the credit it built up while idle."""
+
+    def __init__(self):
+        self.vtime: dict[str, float] = {}
+        self._virtual = 0.0
+
+    def pick(self, ready: list[str]) -> str:
+        for name in ready:
+            self.vtime[name] = max(self.vtime.get(name, 0.0), self._virtual)
+        name = min(ready, key=self.vtime.__getitem__)
+        self._virtual = self.vtime[name]
+        return name
+
+    def charge(self, name: str, seconds: float):
+        self.vtime[name] = self.vtime.get(name, self._virtual) + seconds
+
+
+# Priority classes of polled entries, highest first.  A class may only spend bus
+# time while the budget holds more than its reserve (a fraction of the bucket's
+# capacity), so the classes above it always find bus time left when they fall due.
+PRIORITY_CLASSES: tuple = ("telemetry", "settings", "statistics", "system")
+_CLASS_RESERVE: tuple = (0.0, 0.25, 0.5, 0.75)
+
+
+def priority_class(config, name: str, vals: dict) -> int:
+    """Bus budget class of an mqtt_config entry (index into PRIORITY_CLASSES):
+    energy totals are statistics, writable entries settings, entries polled at the
+    config module's system_interval system info, and everything else telemetry."""
+    if name.startswith("statistics/"):
+        return PRIORITY_CLASSES.index("statistics")
+    if "command_topic" in vals.get("config", {}):
+        return PRIORITY_CLASSES.index("settings")
+    if name.startswith("system/") and vals["interval"] == config.system_interval:
+        return PRIORITY_CLASSES.index("system")
+    return PRIORITY_CLASSES.index("telemetry")
+
+
+class TokenBucket:
+    """Bus-time budget in seconds.  It refills at rate seconds of bus time per
+    second (the share of the bus this bridge may occupy) up to capacity, and is
+    charged each transaction's measured duration after the fact, so a timeout
+    costs what it actually took and can leave the budget in debt."""
+
+    def __init__(self, rate: float, capacity: float, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self._level = capacity
+        self._updated = clock()
+        # Total seconds charged, for reporting occupancy
+        self.spent = 0.0
+
+    def level(self) -> float:
+        now = self.clock()
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.rate)
+        self._updated = now
+        return self._level
+
+    def charge(self, seconds: float):
+        self._level = self.level() - seconds
+        self.spent += seconds
+
+    def floor(self, priority: int) -> float:
+        return _CLASS_RESERVE[priority] * self.capacity
+
+    def allows(self, priority: int) -> bool:
+        """True if a class (index into PRIORITY_CLASSES) may start a transaction now."""
+        return self.level() >= self.floor(priority)
+
+    def time_until(self, priority: int) -> float:
+        """Seconds until allows(priority) becomes true."""
+        return max(0.0, (self.floor(priority) - self.level()) / self.rate)
+
+
+# A read is late when it is serviced more than _LATE_FRACTION of its interval
+# after its deadline.  Windows with more than _MISS_HIGH of their reads late are
+# overloaded, windows with less than _MISS_LOW are calm; the gap between the two
+# and the run lengths below keep the stretch factors from oscillating.
+_LATE_FRACTION = 0.5
+_MISS_HIGH = 0.1
+_MISS_LOW = 0.02
+_OVERLOADED_WINDOWS = 2
+_CALM_WINDOWS = 3
+_RELAX_STEP = 1.5
+
+
+class IntervalGovernor:
+    """Stretches the intervals of the lower priority classes while reads keep
+    missing their deadlines, and restores them once the bus keeps up again.
+
+    After _OVERLOADED_WINDOWS overloaded windows in a row, the lowest class not
+    yet at maximum is stretched by 1 + the fraction of reads that were late, so
+    the step grows with the overload.  Telemetry is never stretched.  After
+    _CALM_WINDOWS calm windows the highest stretched class is relaxed by
+    _RELAX_STEP, undoing the stretches in reverse order."""
+
+    def __init__(self, maximum: float = 8.0, window: float = 30.0, clock=time.monotonic):
+        self.maximum = maximum
+        self.window = window
+        self.clock = clock
+        self.factors: list[float] = [1.0] * len(PRIORITY_CLASSES)
+        # Fraction of reads that were late in the last complete window
+        self.miss_ratio = 0.0
+        self._reads = 0
+        self._late = 0
+        self._started = clock()
+        self._overloaded = 0
+        self._calm = 0
+
+    def interval(self, priority: int, interval: float) -> float:
+        """Effective interval of an entry of the given class."""
+        return interval * self.factors[priority]
+
+    def observe(self, lag: float, interval: float):
+        """Record that an entry polled every interval seconds was read lag seconds late."""
+        if interval <= 0:
+            return
+        self._reads += 1
+        if lag > _LATE_FRACTION * interval:
+            self._late += 1
+        now = self.clock()
+        if now - self._started >= self.window:
+            self._close_window(now)
+
+    def _close_window(self, now: float):
+        self.miss_ratio = self._late / self._reads if self._reads else 0.0
+        self._reads = self._late = 0
+        self._started = now
+        if self.miss_ratio > _MISS_HIGH:
+            self._calm = 0
+            self._overloaded += 1
+            if self._overloaded >= _OVERLOADED_WINDOWS:
+                self._overloaded = 0
+                self._stretch(1 + self.miss_ratio)
+        elif self.miss_ratio < _MISS_LOW:
+            self._overloaded = 0
+            self._calm += 1
+            if self._calm >= _CALM_WINDOWS:
+                self._calm = 0
+                self._relax()
+        else:
+            self._overloaded = self._calm = 0
+
+    def _stretch(self, step: float):
+        for priority in reversed(range(1, len(self.factors))):
+            if self.factors[priority] < self.maximum:
+                self.factors[priority] = min(self.maximum, self.factors[priority] * step)
+                return
+
+    def _relax(self):
+        for priority in range(1, len(self.factors)):
+            if self.factors[priority] > 1.0:
+                self.factors[priority] = max(1.0, self.factors[priority] / _RELAX_STEP)
+                return
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""Simulated SRNE inverter for benchmarks and tests.
+
+Usage:
+    python3 simulator.py [--link /tmp/srne-sim] [--tcp 5020] [--rtu-tcp 5021]
+                         [--address 1] [--baudrate 9600] [--turnaround 0.02]
+                         [--timeout-rate 0] [--crc-rate 0] [--unsupported E020-E027]
+                         [--seed 1]
+
+Serves the register map of docs/register_table.txt as one or more Modbus
+slaves.  Point the bridge at it without changes:
+
+    MODBUS_DEVICE=/tmp/srne-sim           RTU over a pseudo-terminal (--link)
+    MODBUS_DEVICE=tcp://127.0.0.1:5020    Modbus TCP (--tcp)
+    MODBUS_DEVICE=rtu+tcp://127.0.0.1:5021  RTU over TCP (--rtu-tcp)
+
+Every front end shares one simulated RS485 line.  Each transaction occupies it
+for the request and response frames at --baudrate, the 3.5 character silences
+and the inverter's --turnaround.  Registers outside the table, and any given
+with --unsupported, answer "Illegal Data Address".  Writes are accepted on RW
+and W registers.  Timeouts and corrupt frames are injected at the given rates
+from a seeded generator, so a run is reproducible.
+"""
+
+import os
+import sys
+import tty
+import random
+import struct
+import asyncio
+from datetime import datetime
+
+import rtu
+import register_map
+
+
+def _encode_str(text: str, length: int) -> list[int]:
+    data = text.encode("ascii")[: 2 * length].ljust(2 * length, b"\x00")
+    return [(data[2 * i] << 8) | data[2 * i + 1] for i in range(length)]
+
+
+class Inverter:
+    """Register contents of one simulated slave."""
+
+    def __init__(self, address: int, rows: list, unsupported: set, rng: random.Random):
+        self.address = address
+        self.values: dict[int, int] = {}
+        self.writable: set = set()
+        for row in rows:
+            registers = range(row.address, row.address + row.length)
+            if row.access in ("RW", "W"):
+                self.writable.update(registers)
+            for register in registers:
+                self.values.setdefault(register, self._initial(row, rng))
+        for register in unsupported:
+            self.values.pop(register, None)
+        self._store(0x0035, _encode_str(f"SIM{address:03d}-{rng.randrange(10**8):08d}", 20))
+        self._store(0x0014, [100, 100])
+        self._store(0xE003, [48])
+        self._store(0x0100, [rng.randint(20, 100)])
+        # No active faults
+        self._store(0x0200, [0] * 8)
+        now = datetime.now()
+        self._store(0x020C, [((now.year - 2000) << 8) | now.month, (now.day << 8) | now.hour, (now.minute << 8) | now.second])
+
+    @staticmethod
+    def _initial(row, rng: random.Random) -> int:
+        if row.reserved or row.format == "%s":
+            return 0
+        for value in (row.default, row.minimum):
+            if value is not None:
+                return int(round(value / row.scale)) & 0xFFFF
+        if row.access == "W":
+            return 0
+        return rng.randint(0, 500)
+
+    def _store(self, register: int, values: list[int]):
+        for offset, value in enumerate(values):
+            if register + offset in self.values:
+                self.values[register + offset] = value
+
+    def handle(self, pdu: bytes) -> bytes:
+        """Response PDU (possibly an exception) to a request PDU."""
+        function = pdu[0]
+        try:
+            if function == rtu.READ_HOLDING_REGISTERS:
+                _, register, count = struct.unpack(">BHH", pdu[:5])
+                if not 1 <= count <= rtu.MAX_READ_REGISTERS:
+                    raise rtu.SlaveExceptionError(3)
+                registers = range(register, register + count)
+                if any(r not in self.values for r in registers):
+                    raise rtu.SlaveExceptionError(2)
+                return struct.pack(f">BB{count}H", function, 2 * count, *(self.values[r] for r in registers))
+            if function == rtu.WRITE_SINGLE_REGISTER:
+                _, register, value = struct.unpack(">BHH", pdu[:5])
+                self._write(register, [value])
+                return pdu[:5]
+            if function == rtu.WRITE_MULTIPLE_REGISTERS:
+                _, register, count, nbytes = struct.unpack(">BHHB", pdu[:6])
+                if not 1 <= count <= rtu.MAX_WRITE_REGISTERS or nbytes != 2 * count:
+                    raise rtu.SlaveExceptionError(3)
+                self._write(register, list(struct.unpack_from(f">{count}H", pdu, 6)))
+                return pdu[:5]
+            raise rtu.SlaveExceptionError(1)
+        except rtu.SlaveExceptionError as e:
+            return bytes([function | 0x80, e.code])
+        except struct.error:
+            return bytes([function | 0x80, 3])
+
+    def _write(self, register: int, values: list[int]):
+        registers = range(register, register + len(values))
+        if any(r not in self.values or r not in self.writable for r in registers):
+            raise rtu.SlaveExceptionError(2)
+        for r, value in zip(registers, values):
+            self.values[r] = value
+
+
+def request_length(buffer: bytes) -> int | None:
+    """Length of the RTU request frame at the start of buffer, or None until enough has arrived."""
+    if len(buffer) < 2:
+        return None
+    if buffer[1] == rtu.WRITE_MULTIPLE_REGISTERS:
+        return 9 + buffer[6] if len(buffer) >= 7 else None
+    return 8
+
+
+class Bus:
+    """The simulated RS485 line shared by every front end."""
+
+    def __init__(self, inverters: dict, baudrate: int, turnaround: float, timeout_rate: float, crc_rate: float, rng: random.Random):
+        self.inverters = inverters
+        self.baudrate = baudrate
+        self.turnaround = turnaround
+        self.timeout_rate = timeout_rate
+        self.crc_rate = crc_rate
+        self.rng = rng
+        self.lock = asyncio.Lock()
+        self.transactions = 0
+
+    def frame_time(self, nbytes: float) -> float:
+        return nbytes * 10 / self.baudrate
+
+    async def transact(self, slave: int, pdu: bytes) -> bytes | None:
+        """RTU response frame to a request, after the time it takes on the line.
+        None if the slave does not answer."""
+        async with self.lock:
+            self.transactions += 1
+            inverter = self.inverters.get(slave)
+            request_time = self.frame_time(len(pdu) + 3 + 3.5)
+            if inverter is None or self.rng.random() < self.timeout_rate:
+                await asyncio.sleep(request_time)
+                return None
+            response = rtu.frame(slave, inverter.handle(pdu))
+            if self.rng.random() < self.crc_rate:
+                response = response[:-1] + bytes([response[-1] ^ 0xFF])
+            await asyncio.sleep(request_time + self.turnaround + self.frame_time(len(response) + 3.5))
+            return response
+
+
+async def serve_pty(bus: Bus, link: str):
+    """RTU over a pseudo-terminal; link is symlinked to its slave side."""
+    master, slave = os.openpty()
+    tty.setraw(slave)
+    name = os.ttyname(slave)
+    if os.path.lexists(link):
+        os.unlink(link)
+    os.symlink(name, link)
+    print(f"RTU on {link} -> {name}")
+    loop = asyncio.get_running_loop()
+    buffer = bytearray()
+    ready = asyncio.Event()
+
+    def on_readable():
+        try:
+            buffer.extend(os.read(master, 512))
+        except OSError:
+            return
+        ready.set()
+
+    loop.add_reader(master, on_readable)
+    try:
+        while True:
+            await ready.wait()
+            ready.clear()
+            while (length := request_length(buffer)) is not None and len(buffer) >= length:
+                frame, buffer[:] = bytes(buffer[:length]), buffer[length:]
+                try:
+                    pdu = rtu.unframe(frame[0], frame)
+                except rtu.ModbusError:
+                    buffer.clear()  # out of sync: drop everything, as a slave would on a garbled line
+                    break
+                response = await bus.transact(frame[0], pdu)
+                if response is not None:
+                    os.write(master, response)
+    finally:
+        loop.remove_reader(master)
+        os.unlink(link)
+
+
+async def serve_rtu_tcp(bus: Bus, port: int):
+    """Raw RTU frames over TCP, like a transparent RS485 gateway."""
+
+    async def client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        buffer = bytearray()
+        try:
+            while chunk := await reader.read(512):
+                buffer.extend(chunk)
+                while (length := request_length(buffer)) is not None and len(buffer) >= length:
+                    frame, buffer[:] = bytes(buffer[:length]), buffer[length:]
+                    try:
+                        pdu = rtu.unframe(frame[0], frame)
+                    except rtu.ModbusError:
+                        buffer.clear()
+                        break
+                    response = await bus.transact(frame[0], pdu)
+                    if response is not None:
+                        writer.write(response)
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(client, "127.0.0.1", port)
+    print(f"RTU over TCP on 127.0.0.1:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+async def serve_tcp(bus: Bus, port: int):
+    """Modbus TCP, like a gateway that forwards each request onto the RS485 line.
+    Pipelined requests are answered in order as the line frees up."""
+
+    async def client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                transaction, protocol, length, unit = struct.unpack(">HHHB", await reader.readexactly(7))
+                pdu = await reader.readexactly(length - 1)
+                response = await bus.transact(unit, pdu)
+                if response is None or rtu.crc16(response[:-2]) != struct.unpack("<H", response[-2:])[0]:
+                    continue  # the gateway drops a missing or corrupt reply
+                response_pdu = response[1:-2]
+                writer.write(struct.pack(">HHHB", transaction, protocol, len(response_pdu) + 1, unit) + response_pdu)
+        except asyncio.IncompleteReadError:
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(client, "127.0.0.1", port)
+    print(f"Modbus TCP on 127.0.0.1:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def _parse_ranges(text: str) -> set:
+    registers = set()
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        first, _, last = part.partition("-")
+        registers.update(range(int(first, 16), int(last or first, 16) + 1))
+    return registers
+
+
+async def run(args):
+    rng = random.Random(args.seed)
+    rows = register_map.load_table(args.table)
+    unsupported = _parse_ranges(args.unsupported)
+    inverters = {address: Inverter(address, rows, unsupported, rng) for address in (int(a) for a in args.address.split(","))}
+    bus = Bus(inverters, args.baudrate, args.turnaround, args.timeout_rate, args.crc_rate, rng)
+    print(f"Simulating {len(inverters)} inverter(s) at {args.baudrate} baud with {len(rows)} table rows")
+    servers = []
+    if args.link:
+        servers.append(serve_pty(bus, args.link))
+    if args.tcp:
+        servers.append(serve_tcp(bus, args.tcp))
+    if args.rtu_tcp:
+        servers.append(serve_rtu_tcp(bus, args.rtu_tcp))
+    await asyncio.gather(*servers)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--link", default=None, help="Path to symlink to the pty's slave side")
+    parser.add_argument("--tcp", type=int, default=None, help="Serve Modbus TCP on this port")
+    parser.add_argument("--rtu-tcp", type=int, default=None, help="Serve RTU over TCP on this port")
+    parser.add_argument("--address", default="1", help="Slave address(es), comma separated (default: 1)")
+    parser.add_argument("--baudrate", type=int, default=9600, help="Simulated line speed (default: 9600)")
+    parser.add_argument("--turnaround", type=float, default=0.02, help="Inverter response time in seconds (default: 0.02)")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="Fraction of requests left unanswered")
+    parser.add_argument("--crc-rate", type=float, default=0.0, help="Fraction of responses sent with a bad CRC")
+    parser.add_argument("--unsupported", default="", help="Extra unsupported registers, e.g. E020-E027,0250")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for register values and fault injection")
+    parser.add_argument("--table", default=register_map.TABLE, help="Register table (default: docs/register_table.txt)")
+    args = parser.parse_args()
+    if not (args.link or args.tcp or args.rtu_tcp):
+        parser.error("give at least one of --link, --tcp, --rtu-tcp")
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        pass
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Snapshot of the last value of every entity, for a warm start.
+
+main.py writes the last value and read time of the entities of every unit to
+SNAPSHOT_FILE every SNAPSHOT_INTERVAL seconds, but only when they changed, off
+the event loop and atomically (written to a temporary file that replaces the
+old one), so a crash mid-write leaves the previous snapshot in place.
+
+On start the snapshot is published right after discovery, so Home Assistant
+shows the last known values instead of "unknown" until each entity is read
+again at its normal cadence.  Each restored value is marked stale on the
+entity's attributes topic ({"restored": true, "age": seconds}) until then.
+A snapshot older than SNAPSHOT_MAX_AGE is ignored.
+
+Only entities read from a register are saved.  Values the bridge keeps itself
+(inverter/enable_danger, which has to be re-armed after every start, and the
+bridge statistics) and values computed from other entities start afresh."""
+
+import os
+import json
+import time
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# An empty SNAPSHOT_FILE disables the snapshot
+SNAPSHOT_FILE: str = os.getenv("SNAPSHOT_FILE", "last_values.json")
+SNAPSHOT_INTERVAL: float = float(os.getenv("SNAPSHOT_INTERVAL") or 60)
+SNAPSHOT_MAX_AGE: float = float(os.getenv("SNAPSHOT_MAX_AGE") or 3600)
+snapshot_enabled: bool = bool(SNAPSHOT_FILE)
+
+
+def restorable(entity) -> bool:
+    """True for entities whose value is read from a register of the inverter."""
+    return entity.register is not None
+
+
+def attributes(restored: float | None, now: float) -> str:
+    """Payload of an entity's attributes topic: whether its state is a value
+    restored from the snapshot, read at time restored, or a live one."""
+    if restored is None:
+        return json.dumps({"restored": False})
+    return json.dumps({
+        "restored": True,
+        "read_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(restored)),
+        "age": round(now - restored),
+    })
+
+
+def take(entities) -> dict[str, list]:
+    """[last value, read time] of every restorable entity read in this run or
+    restored and not read since, by name."""
+    values = {}
+    for entity in entities:
+        if not restorable(entity):
+            continue
+        read = entity.last_update if entity.last_update is not None else entity.restored
+        if read is not None and entity.last_value is not None:
+            values[entity.name] = [entity.last_value, read]
+    return values
+
+
+def load(path: str = SNAPSHOT_FILE) -> dict[str, dict[str, list]]:
+    """Snapshot by unit topic, or {} if there is none or it is too old."""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"Could not load snapshot {path}: {e}")
+        return {}
+    age = time.time() - data.get("saved", 0)
+    if age > SNAPSHOT_MAX_AGE:
+        print(f"Snapshot {path} is {age:.0f}s old — not restored")
+        return {}
+    return data.get("units", {})
+
+
+def save(units: dict[str, dict[str, list]], path: str = SNAPSHOT_FILE):
+    temp = f"{path}.tmp"
+    try:
+        with open(temp, "w") as f:
+            json.dump({"saved": time.time(), "units": units}, f, separators=(",", ":"))
+        os.replace(temp, path)
+    except Exception as e:
+        print(f"Could not write snapshot {path}: {e}")
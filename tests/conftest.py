@@ -0,0 +1,27 @@
+"""The bridge modules read their settings from the environment when imported,
+so the test environment is set up before any of them is imported: no Modbus
+device, state files in a temporary directory, dummy MQTT credentials."""
+
+import os
+import sys
+import tempfile
+
+_STATE = tempfile.mkdtemp(prefix="srne-tests-")
+
+os.environ.update({
+    "MODBUS_DEVICE": "",
+    "MODBUS_ADDRESS": "1",
+    "MQTT_TOPIC": "srne",
+    "MQTT_HOST": "127.0.0.1",
+    "MQTT_USERNAME": "test",
+    "MQTT_PASSWORD": "test",
+    "SYNC_DATETIME_INTERVAL": "60",
+    "MODBUS_PROBE": "false",
+    "MODBUS_SKIP_STATE_FILE": os.path.join(_STATE, "skip.json"),
+    "MODBUS_CAPABILITY_CACHE": os.path.join(_STATE, "capabilities.json"),
+    "ENTITY_MAP_CACHE": os.path.join(_STATE, "entity_map.cache"),
+    "SNAPSHOT_FILE": "",
+    "BATTERY_CONNECTED": "true",
+})
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
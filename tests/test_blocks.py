@@ -0,0 +1,31 @@
+import pytest
+import modbus
+
+
+@pytest.fixture
+def dev():
+    dev = modbus.devices[0]
+    with modbus.use_device(dev):
+        yield dev
+    dev.register_skip_time.clear()
+    dev.register_failures.clear()
+    dev.last_error.clear()
+    dev.unblockable.clear()
+
+
+# Battery settings 0xE01E - 0xE023, with 0xE020 and 0xE021 not polled
+SPANS = [(0xE01E, 1), (0xE01F, 1), (0xE022, 1), (0xE023, 1)]
+
+
+def test_gap_is_bridged(dev):
+    assert modbus.plan_blocks(SPANS) == [(0xE01E, 6)]
+
+
+def test_rejected_register_in_gap_splits_block(dev):
+    modbus.apply_capabilities({0xE020: False})
+    assert modbus.plan_blocks(SPANS) == [(0xE01E, 2), (0xE022, 2)]
+
+
+def test_rejected_span_starts_no_block(dev):
+    modbus.apply_capabilities({0xE01F: False})
+    assert modbus.plan_blocks(SPANS) == [(0xE022, 2)]
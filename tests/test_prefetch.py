@@ -0,0 +1,86 @@
+import random
+import asyncio
+import pytest
+import rtu
+import modbus
+import register_map
+import simulator
+
+
+class SimulatedTransport:
+    """Answers from a simulator.Inverter without wire time and counts transactions."""
+
+    pipeline_depth = 1
+    baudrate = 9600
+
+    def __init__(self, inverter, timeout_blocks: bool = False):
+        self.inverter = inverter
+        self.timeout_blocks = timeout_blocks
+        self.transactions = 0
+
+    def frame_time(self, nbytes: int) -> float:
+        return nbytes * 10 / self.baudrate
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    async def request(self, slave: int, pdu: bytes, timeout: float):
+        self.transactions += 1
+        if self.timeout_blocks and int.from_bytes(pdu[3:5], "big") > 1:
+            raise rtu.NoResponseError("no response")
+        return self.inverter.handle(pdu), 0.0
+
+
+@pytest.fixture
+def connect():
+    dev = modbus.devices[0]
+    original = dev.client.transport
+
+    def connect(unsupported=(), timeout_blocks=False):
+        inverter = simulator.Inverter(1, register_map.REGISTERS, set(unsupported), random.Random(1))
+        dev.client.transport = SimulatedTransport(inverter, timeout_blocks)
+        return dev.client.transport
+
+    with modbus.use_device(dev):
+        yield connect
+        modbus.clear_block_buffer()
+    dev.client.transport = original
+    for state in (dev.register_skip_time, dev.register_failures, dev.last_error, dev.unblockable, dev.block_breaks):
+        state.clear()
+
+
+# Battery settings 0xE01E - 0xE023; 0xE020 and 0xE021 lie in the gap
+SPANS = [(0xE01E, 1), (0xE01F, 1), (0xE022, 1), (0xE023, 1)]
+
+
+def sweep(transport) -> int:
+    before = transport.transactions
+    attempted = asyncio.run(modbus.prefetch(SPANS))
+    assert attempted == set(SPANS)
+    assert all(modbus.is_buffered(*span) for span in SPANS)
+    modbus.clear_block_buffer()
+    return transport.transactions - before
+
+
+def test_healthy_block_is_one_transaction(connect):
+    transport = connect()
+    assert sweep(transport) == 1
+
+
+def test_rejected_block_is_split_around_the_unsupported_address(connect):
+    transport = connect(unsupported={0xE020})
+    # The block, then its two halves, which stay coalesced
+    assert sweep(transport) == 3
+    assert modbus.current_device().unblockable == {}
+    # Later sweeps read the two halves straight away
+    assert sweep(transport) == 2
+    assert sweep(transport) == 2
+
+
+def test_timed_out_block_falls_back_to_single_reads(connect):
+    transport = connect(timeout_blocks=True)
+    assert sweep(transport) == 1 + len(SPANS)
+    assert set(modbus.current_device().unblockable) == {register for register, _ in SPANS}
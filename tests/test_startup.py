@@ -0,0 +1,63 @@
+import asyncio
+import pytest
+import main
+
+
+class RecordingClient:
+    """Stands in for the paho client and records what is published."""
+
+    def __init__(self):
+        self.published = []
+
+    def publish(self, topic, payload=None, retain=False):
+        self.published.append((topic, payload, retain))
+
+    def subscribe(self, *args, **kwargs):
+        pass
+
+    def message_callback_add(self, *args, **kwargs):
+        pass
+
+    def is_connected(self):
+        return True
+
+
+@pytest.fixture
+def unit(monkeypatch):
+    unit = main.units[0]
+    entry = unit.mqtt_config["battery/type"]
+    monkeypatch.setitem(entry, "last_value", None)
+    monkeypatch.setattr(unit, "last_equalization_avail", "")
+    monkeypatch.setattr(main, "_discovery_published", asyncio.Event())
+    return unit
+
+
+def equalization(client, unit):
+    return [payload for topic, payload, _ in client.published if topic == unit.equalization_avail_topic]
+
+
+def test_equalization_availability_waits_for_battery_type(unit):
+    client = RecordingClient()
+    main.publish_discovery(client)
+    assert equalization(client, unit) == []
+
+    unit.entities["battery/type"].remember("FLD", 0.0)
+    main.publish_equalization_availability(client, unit)
+    assert equalization(client, unit) == ["online"]
+
+
+def test_start_bus_failure_reaches_caller(monkeypatch):
+    async def start_bus(worker):
+        raise OSError("no such serial port")
+
+    async def mqtt_loop():
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(main, "start_bus", start_bus)
+    monkeypatch.setattr(main, "mqtt_loop", mqtt_loop)
+    monkeypatch.setattr(main, "_stopped", asyncio.Event())
+    monkeypatch.setattr(main, "_units_ready", asyncio.Event())
+    monkeypatch.setattr(main, "_discovery_published", asyncio.Event())
+    with pytest.raises(OSError, match="no such serial port"):
+        asyncio.run(asyncio.wait_for(main.main(), 5))
+    assert not main._units_ready.is_set()
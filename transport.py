@@ -0,0 +1,466 @@
+"""Asyncio Modbus transports and the blocking facade used by the modbus.py helpers.
+
+A transport's request() returns the response PDU together with the response
+latency: the seconds the slave took to answer, not counting wire time."""
+
+import asyncio
+import contextlib
+import contextvars
+import heapq
+import itertools
+import os
+import struct
+import threading
+import time
+import serial
+from urllib.parse import urlsplit
+
+import rtu
+import capture
+from latency import LatencyTracker
+
+
+class SerialRtuTransport:
+    """Modbus RTU over a serial port, driven directly from the event loop.
+
+    The port is opened non-blocking and its file descriptor is watched with
+    loop.add_reader, so a transaction never ties up a thread while waiting for
+    the inverter.  The port is opened lazily and reopened after close()."""
+
+    pipeline_depth = 1
+
+    def __init__(self, port: str, baudrate: int = 9600):
+        self.port = port
+        self.baudrate = baudrate
+        self._serial = None
+        self._lock = None
+        self._lock_loop = None
+        self._idle_at = 0.0
+
+    def frame_time(self, nbytes: int) -> float:
+        """Seconds needed to clock nbytes onto the bus (8N1 = 10 bits per byte)."""
+        return nbytes * 10 / self.baudrate
+
+    def _bus_lock(self) -> asyncio.Lock:
+        # The facade may run transactions on a private loop before the engine
+        # starts, so the lock is recreated for whichever loop is driving the bus.
+        loop = asyncio.get_running_loop()
+        if self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def open(self):
+        if not self.port:
+            raise rtu.ModbusError("no Modbus device configured")
+        self._serial = serial.Serial(self.port, self.baudrate, timeout=0)
+
+    def close(self):
+        if self._serial is not None:
+            try:
+                self._serial.close()
+            finally:
+                self._serial = None
+
+    async def request(self, slave: int, pdu: bytes, timeout: float) -> bytes:
+        async with self._bus_lock():
+            if self._serial is None:
+                self.open()
+            loop = asyncio.get_running_loop()
+            # Modbus RTU requires 3.5 character times of silence between frames
+            silence = self._idle_at - loop.time()
+            if silence > 0:
+                await asyncio.sleep(silence)
+            self._serial.reset_input_buffer()
+
+            request = rtu.frame(slave, pdu)
+            fd = self._serial.fileno()
+            received = bytearray()
+            done = loop.create_future()
+
+            def on_readable():
+                try:
+                    received.extend(os.read(fd, 512))
+                except BlockingIOError:
+                    return
+                except OSError as e:
+                    if not done.done():
+                        done.set_exception(e)
+                    return
+                if not done.done() and len(received) >= rtu.expected_frame_length(pdu, received):
+                    done.set_result(None)
+
+            loop.add_reader(fd, on_readable)
+            try:
+                os.write(fd, request)
+                sent = loop.time()
+                wire_time = self.frame_time(len(request) + rtu.expected_frame_length(pdu, b""))
+                await asyncio.wait_for(done, timeout + wire_time)
+            except asyncio.TimeoutError:
+                if received:
+                    raise rtu.InvalidResponseError(f"incomplete frame: {bytes(received).hex()}") from None
+                raise rtu.NoResponseError(f"no response from slave {slave}") from None
+            finally:
+                loop.remove_reader(fd)
+                self._idle_at = loop.time() + self.frame_time(3.5)
+            latency = max(0.0, loop.time() - sent - self.frame_time(len(request) + len(received)))
+            return rtu.unframe(slave, bytes(received)), latency
+
+
+class _StreamTransport:
+    """Shared connection handling for the socket transports.  The connection is
+    opened on the first request and after any error, so a gateway reboot costs
+    one failed transaction instead of a restart."""
+
+    pipeline_depth = 1
+
+    def __init__(self, host: str, port: int, baudrate: int = 9600):
+        self.host = host
+        self.port = port
+        # Baud rate of the RS485 side of the gateway, used to budget wire time
+        self.baudrate = baudrate
+        self._reader = None
+        self._writer = None
+        self._connect_lock = None
+        self._lock_loop = None
+
+    def frame_time(self, nbytes: int) -> float:
+        return nbytes * 10 / self.baudrate
+
+    def open(self):
+        pass  # connected lazily from request()
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+    def _locks(self):
+        loop = asyncio.get_running_loop()
+        if self._lock_loop is not loop:
+            self._lock_loop = loop
+            self._connect_lock = asyncio.Lock()
+            self._reset_locks()
+            # A connection made on another loop cannot be used from this one
+            self._reader = self._writer = None
+
+    def _reset_locks(self):
+        pass
+
+    async def _connect(self):
+        async with self._connect_lock:
+            if self._writer is None:
+                self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+                self._on_connected()
+
+    def _on_connected(self):
+        pass
+
+
+class TcpTransport(_StreamTransport):
+    """Modbus TCP (MBAP framing).  Up to pipeline_depth requests are kept in flight
+    and matched to their responses by transaction id."""
+
+    def __init__(self, host: str, port: int = 502, baudrate: int = 9600, pipeline_depth: int = 4):
+        super().__init__(host, port, baudrate)
+        self.pipeline_depth = max(1, pipeline_depth)
+        self._transaction = 0
+        self._pending: dict[int, asyncio.Future] = {}
+        self._slots = None
+        self._reader_task = None
+
+    def _reset_locks(self):
+        self._slots = asyncio.Semaphore(self.pipeline_depth)
+        self._pending = {}
+
+    def close(self):
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+        self._fail_pending(rtu.ModbusError("connection closed"))
+        super().close()
+
+    def _fail_pending(self, error: Exception):
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+
+    def _on_connected(self):
+        self._reader_task = asyncio.get_running_loop().create_task(self._read_responses(self._reader))
+
+    async def _read_responses(self, reader: asyncio.StreamReader):
+        try:
+            while True:
+                transaction, protocol, length, _unit = struct.unpack(">HHHB", await reader.readexactly(7))
+                pdu = await reader.readexactly(length - 1)
+                future = self._pending.pop(transaction, None)
+                if protocol == 0 and future is not None and not future.done():
+                    future.set_result(pdu)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._fail_pending(rtu.ModbusError(f"connection lost: {e}"))
+            self._reader_task = None
+            super().close()
+
+    async def request(self, slave: int, pdu: bytes, timeout: float) -> bytes:
+        self._locks()
+        async with self._slots:
+            try:
+                await self._connect()
+            except OSError as e:
+                raise rtu.ModbusError(f"cannot connect to {self.host}:{self.port}: {e}") from e
+            self._transaction = (self._transaction + 1) & 0xFFFF
+            transaction = self._transaction
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[transaction] = future
+            self._writer.write(struct.pack(">HHHB", transaction, 0, len(pdu) + 1, slave) + pdu)
+            sent = loop.time()
+            # The gateway serialises pipelined requests onto RS485, so allow for
+            # every request queued ahead of this one.
+            queued = len(self._pending)
+            wire_time = self.frame_time(8 + 2 + rtu.response_pdu_length(pdu) + 3)
+            try:
+                response = await asyncio.wait_for(future, (timeout + wire_time) * queued)
+                return response, max(0.0, (loop.time() - sent) / queued - wire_time)
+            except asyncio.TimeoutError:
+                self._pending.pop(transaction, None)
+                raise rtu.NoResponseError(f"no response from unit {slave} via {self.host}:{self.port}") from None
+
+
+class RtuOverTcpTransport(_StreamTransport):
+    """Raw RTU frames tunnelled through a TCP socket (transparent RS485 gateways).
+    RTU has no transaction ids, so requests are strictly one at a time and the
+    connection is dropped after a bad or missing reply to discard late bytes."""
+
+    def _reset_locks(self):
+        self._bus = asyncio.Lock()
+
+    async def request(self, slave: int, pdu: bytes, timeout: float) -> bytes:
+        self._locks()
+        async with self._bus:
+            try:
+                await self._connect()
+            except OSError as e:
+                raise rtu.ModbusError(f"cannot connect to {self.host}:{self.port}: {e}") from e
+            loop = asyncio.get_running_loop()
+            request = rtu.frame(slave, pdu)
+            self._writer.write(request)
+            sent = loop.time()
+            received = bytearray()
+            wire_time = self.frame_time(len(request) + rtu.expected_frame_length(pdu, b""))
+            try:
+                await asyncio.wait_for(self._read_frame(pdu, received), timeout + wire_time)
+                latency = max(0.0, loop.time() - sent - self.frame_time(len(request) + len(received)))
+                return rtu.unframe(slave, bytes(received)), latency
+            except asyncio.TimeoutError:
+                self.close()
+                if received:
+                    raise rtu.InvalidResponseError(f"incomplete frame: {bytes(received).hex()}") from None
+                raise rtu.NoResponseError(f"no response from slave {slave} via {self.host}:{self.port}") from None
+            except Exception:
+                self.close()
+                raise
+
+    async def _read_frame(self, pdu: bytes, received: bytearray):
+        while len(received) < rtu.expected_frame_length(pdu, received):
+            chunk = await self._reader.read(512)
+            if not chunk:
+                raise rtu.ModbusError("connection closed by gateway")
+            received.extend(chunk)
+
+
+# Bus priorities: commands from MQTT are granted the bus ahead of queued polling reads
+PRIORITY_COMMAND = 0
+PRIORITY_READ = 1
+
+_priority = contextvars.ContextVar("bus_priority", default=PRIORITY_READ)
+
+
+@contextlib.contextmanager
+def command_lane():
+    """Run the transactions issued inside the block (including those the blocking
+    facade issues from a worker thread) at command priority."""
+    token = _priority.set(PRIORITY_COMMAND)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class BusLock:
+    """Grants the bus to one transaction at a time (pipeline_depth for Modbus TCP),
+    serving waiting commands before waiting reads and each class in arrival order.
+
+    It is held for a single transaction, never for a whole poll batch, so a
+    command waits at most for the transactions already on the wire.  While a
+    command batch has the bus reserved, reads are not granted between its
+    transactions.  meter, if given, is called with the seconds the bus was in
+    use: wall-clock time with at least one transaction in flight, so pipelined
+    requests are not counted twice."""
+
+    def __init__(self, slots: int = 1, meter=None):
+        self.slots = slots
+        self.meter = meter
+        self._busy = 0
+        self._busy_mark = 0.0
+        self._reserved = 0
+        self._waiters: list = []
+        self._order = itertools.count()
+
+    def _grant(self):
+        while self._waiters and self._busy < self.slots:
+            priority, _, future = self._waiters[0]
+            if self._reserved and priority > PRIORITY_COMMAND and not future.done():
+                return
+            heapq.heappop(self._waiters)
+            if not future.done():
+                self._set_busy(1)
+                future.set_result(None)
+
+    def _set_busy(self, delta: int):
+        now = time.monotonic()
+        if self._busy and self.meter is not None:
+            self.meter(now - self._busy_mark)
+        self._busy_mark = now
+        self._busy += delta
+
+    @contextlib.contextmanager
+    def reserve(self):
+        """Keep reads off the bus for the duration of a command batch that issues
+        several transactions (e.g. a read-modify-write followed by its write)."""
+        self._reserved += 1
+        try:
+            yield
+        finally:
+            self._reserved -= 1
+            self._grant()
+
+    @contextlib.asynccontextmanager
+    async def hold(self, priority: int | None = None):
+        if priority is None:
+            priority = _priority.get()
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._order), future))
+        self._grant()
+        if not future.done():
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # Granted just as we were cancelled: pass the slot on
+                    self._set_busy(-1)
+                    self._grant()
+                raise
+        try:
+            yield
+        finally:
+            self._set_busy(-1)
+            self._grant()
+
+
+class ModbusClient:
+    """Register-level requests to one slave over a shared transport.
+
+    Without an explicit timeout, each request waits as long as the latency
+    tracker allows for its start register.  Clients of slaves on the same bus
+    share its BusLock."""
+
+    def __init__(self, transport, slave: int, timeout: float = 0.1, latency: LatencyTracker | None = None, lock: BusLock | None = None):
+        self.transport = transport
+        self.slave = slave
+        self.latency = latency or LatencyTracker(timeout, minimum=timeout, maximum=timeout)
+        self.lock = lock or BusLock(transport.pipeline_depth)
+
+    async def _request(self, register: int, pdu: bytes, timeout: float | None) -> bytes:
+        if timeout is None:
+            timeout = self.latency.timeout_for(register)
+        try:
+            async with self.lock.hold():
+                response, latency = await self.transport.request(self.slave, pdu, timeout)
+        except rtu.NoResponseError:
+            self.latency.record_timeout(register, timeout)
+            raise
+        self.latency.record(register, latency)
+        return rtu.check_response(pdu, response)
+
+    async def read_registers(self, register: int, count: int, timeout: float | None = None) -> list[int]:
+        return rtu.decode_registers(await self._request(register, rtu.read_pdu(register, count), timeout))
+
+    async def write_registers(self, register: int, values: list[int], timeout: float | None = None):
+        await self._request(register, rtu.write_pdu(register, values), timeout)
+
+
+class Instrument:
+    """Blocking facade over a ModbusClient with the subset of the
+    minimalmodbus.Instrument API that the modbus.py helpers use.
+
+    Before the engine binds its event loop, calls run on a private loop.
+    Afterwards they are submitted to the engine loop from the calling thread;
+    calling them from the engine loop itself would deadlock and raises instead."""
+
+    def __init__(self, client: ModbusClient):
+        self.client = client
+        self._loop = None
+        self._private_loop = None
+
+    def bind(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+        if self._private_loop is not None:
+            # Release connections owned by the private loop before closing it.
+            # bind() is called from the running engine loop, so the private loop
+            # gets its final iteration on a helper thread.
+            self.client.transport.close()
+            private = self._private_loop
+            cleanup = threading.Thread(target=lambda: private.run_until_complete(asyncio.sleep(0)))
+            cleanup.start()
+            cleanup.join()
+            private.close()
+            self._private_loop = None
+
+    def _run(self, coro):
+        if self._loop is not None:
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is self._loop:
+                coro.close()
+                raise RuntimeError("blocking Modbus call on the event loop thread")
+            return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+        if self._private_loop is None:
+            self._private_loop = asyncio.new_event_loop()
+        return self._private_loop.run_until_complete(coro)
+
+    def read_register(self, register: int, signed: bool = False) -> int:
+        value = self.read_registers(register, 1)[0]
+        if signed and value >= 0x8000:
+            value -= 0x10000
+        return value
+
+    def read_registers(self, register: int, count: int) -> list[int]:
+        return self._run(self.client.read_registers(register, count))
+
+    def write_register(self, register: int, value: int):
+        # FC16 with a single register, matching minimalmodbus' default
+        self._run(self.client.write_registers(register, [value]))
+
+    def write_registers(self, register: int, values: list[int]):
+        self._run(self.client.write_registers(register, values))
+
+
+def open_transport(device: str, baudrate: int = 9600):
+    """Create the transport for MODBUS_DEVICE: a serial port path,
+    tcp://host[:port] for Modbus TCP, rtu+tcp://host:port for RTU over TCP or
+    replay:///path/to/capture.bin to answer from a recording (see capture.py)."""
+    url = urlsplit(device or "")
+    if url.scheme == "replay":
+        return capture.open_replay(url.path, url.query)
+    if url.scheme == "tcp":
+        depth = int(os.getenv("MODBUS_TCP_PIPELINE") or 4)
+        return TcpTransport(url.hostname, url.port or 502, baudrate, depth)
+    if url.scheme == "rtu+tcp":
+        return RtuOverTcpTransport(url.hostname, url.port or 502, baudrate)
+    return SerialRtuTransport(device, baudrate)